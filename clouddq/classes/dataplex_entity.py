@@ -21,10 +21,42 @@ from clouddq.classes.dataplex_entity_schema import DataplexEntitySchema
 from clouddq.utils import assert_not_none_or_empty
 
 
+REQUIRED_ENTITY_FIELDS = (
+    ("name", "Name: must define non-empty value: 'name'."),
+    ("createTime", "Create Time: must define non-empty value: 'create_time'."),
+    ("updateTime", "Update Time: must define non-empty value: 'update_time'."),
+    ("id", "Id: must define non-empty value: 'id'."),
+    ("type", "Entity type: must define non-empty value: 'entity_type'."),
+    ("asset", "Asset: must define non-empty value: 'asset'."),
+    ("dataPath", "Data Path: must define non-empty value: 'data_path'."),
+    ("system", "System: must define non-empty value: 'system'."),
+    ("format", "Format: must define non-empty value: 'format'."),
+    ("schema", "Schema: must define non-empty value: 'schema'."),
+)
+
+
 @dataclass
 class DataplexEntity:
     """ """
 
+    __slots__ = (
+        "name",
+        "createTime",
+        "updateTime",
+        "id",
+        "type",
+        "asset",
+        "dataPath",
+        "system",
+        "format",
+        "schema",
+        "_project_id",
+        "_location",
+        "_lake",
+        "_zone",
+        "_db_primary_key",
+    )
+
     name: str
     createTime: str
     updateTime: str
@@ -36,27 +68,41 @@ class DataplexEntity:
     format: dict
     schema: DataplexEntitySchema
 
+    def __post_init__(self):
+        name_parts = self.name.split("/")
+        if len(name_parts) < 8:
+            raise ValueError(
+                "Name: must be of the form 'projects/{project_id}/"
+                "locations/{location}/lakes/{lake}/zones/{zone}/entities/{entity}'. "
+                f"Current value: '{self.name}'."
+            )
+        self._project_id = name_parts[1]
+        self._location = name_parts[3]
+        self._lake = name_parts[5]
+        self._zone = name_parts[7]
+        self._db_primary_key = (
+            f"projects/{self._project_id}/locations/{self._location}/"
+            f"lakes/{self._lake}/zones/{self._zone}/entities/{self.id}"
+        )
+
     @property
     def project_id(self):
-        return self.name.split("/")[1]
+        return self._project_id
 
     @property
     def location(self):
-        return self.name.split("/")[3]
+        return self._location
 
     @property
     def lake(self):
-        return self.name.split("/")[5]
+        return self._lake
 
     @property
     def zone(self):
-        return self.name.split("/")[7]
+        return self._zone
 
     def get_db_primary_key(self):
-        return (
-            f"projects/{self.project_id}/locations/{self.location}/"
-            + f"lakes/{self.lake}/zones/{self.zone}/entities/{self.id}"  # noqa: W503
-        )
+        return self._db_primary_key
 
     @classmethod
     def from_dict(cls: DataplexEntity, kwargs: dict) -> DataplexEntity:
@@ -70,76 +116,13 @@ class DataplexEntity:
 
         """
 
-        entity_name = kwargs.get("name")
-        assert_not_none_or_empty(
-            value=entity_name, error_msg="Name: must define non-empty value: 'name'."
-        )
-
-        create_time = kwargs.get("createTime")
-        assert_not_none_or_empty(
-            value=create_time,
-            error_msg="Create Time: must define non-empty value: 'create_time'.",
-        )
-
-        update_time = kwargs.get("updateTime")
-        assert_not_none_or_empty(
-            value=update_time,
-            error_msg="Update Time: must define non-empty value: 'update_time'.",
-        )
-
-        entity_id = kwargs.get("id")
-        assert_not_none_or_empty(
-            value=entity_id, error_msg="Id: must define non-empty value: 'id'."
-        )
-
-        entity_type = kwargs.get("type")
-        assert_not_none_or_empty(
-            value=entity_type,
-            error_msg="Entity type: must define non-empty value: 'entity_type'.",
-        )
-
-        asset = kwargs.get("asset")
-        assert_not_none_or_empty(
-            value=asset, error_msg="Asset: must define non-empty value: 'asset'."
-        )
-
-        data_path = kwargs.get("dataPath")
-        assert_not_none_or_empty(
-            value=data_path,
-            error_msg="Data Path: must define non-empty value: 'data_path'.",
-        )
-
-        system = kwargs.get("system")
-        assert_not_none_or_empty(
-            value=system, error_msg="System: must define non-empty value: 'system'."
-        )
-
-        entity_format = kwargs.get("format")
-        assert_not_none_or_empty(
-            value=entity_format,
-            error_msg="Format: must define non-empty value: 'format'.",
-        )
-
-        schema_dict = kwargs.get("schema")
-        assert_not_none_or_empty(
-            value=schema_dict,
-            error_msg="Schema: must define non-empty value: 'schema'.",
-        )
-
-        schema = DataplexEntitySchema.from_dict(kwargs=schema_dict)
-
-        return DataplexEntity(
-            name=entity_name,
-            createTime=create_time,
-            updateTime=update_time,
-            id=entity_id,
-            type=entity_type,
-            asset=asset,
-            dataPath=data_path,
-            system=system,
-            format=entity_format,
-            schema=schema,
-        )
+        values = {}
+        for key, error_msg in REQUIRED_ENTITY_FIELDS:
+            value = kwargs.get(key)
+            assert_not_none_or_empty(value=value, error_msg=error_msg)
+            values[key] = value
+        values["schema"] = DataplexEntitySchema.from_dict(kwargs=values["schema"])
+        return DataplexEntity(**values)
 
     def to_dict(self: DataplexEntity) -> dict:
         """
@@ -151,7 +134,7 @@ class DataplexEntity:
 
         """
 
-        output = {
+        return {
             "name": self.name,
             "createTime": self.createTime,
             "updateTime": self.updateTime,
@@ -162,11 +145,9 @@ class DataplexEntity:
             "system": self.system,
             "format": self.format,
             "schema": self.schema,
-            "project_id": self.project_id,
-            "location": self.location,
-            "lake": self.lake,
-            "zone": self.zone,
-            "db_primary_key": self.get_db_primary_key(),
+            "project_id": self._project_id,
+            "location": self._location,
+            "lake": self._lake,
+            "zone": self._zone,
+            "db_primary_key": self._db_primary_key,
         }
-
-        return dict(output)
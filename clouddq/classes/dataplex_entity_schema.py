@@ -48,8 +48,6 @@ class DataplexEntitySchema:
 
         """
 
-        output = {
+        return {
             "fields": self.fields,
         }
-
-        return dict(output)
@@ -24,6 +24,8 @@ from clouddq.utils import assert_not_none_or_empty
 class DataplexEntitySchemaField:
     """ """
 
+    __slots__ = ("name", "data_type", "mode")
+
     name: str
     data_type: str
     mode: str
@@ -37,14 +39,12 @@ class DataplexEntitySchemaField:
 
         """
 
-        output = {
+        return {
             "name": self.name,
             "data_type": self.data_type,
             "mode": self.mode,
         }
 
-        return dict(output)
-
     @classmethod
     def from_dict(
         cls: DataplexEntitySchemaField, kwargs: dict
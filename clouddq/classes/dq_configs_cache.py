@@ -15,17 +15,25 @@
 """todo: add classes docstring."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from copy import deepcopy
 from dataclasses import dataclass
+from dataclasses import replace
 from pprint import pformat
 
+import json
 import logging
 import sqlite3
+import time
+import typing
 
 from sqlite_utils import Database
 from sqlite_utils.db import NotFoundError
 
 from clouddq.classes.metadata_registry_defaults import SAMPLE_DEFAULT_REGISTRIES_YAML
 from clouddq.utils import convert_json_value_to_dict
+from clouddq.utils import unnest_object_to_iter
 from clouddq.utils import unnest_object_to_list
 
 import clouddq.classes.dq_entity as dq_entity
@@ -39,20 +47,80 @@ import clouddq.integration.dataplex.clouddq_dataplex as clouddq_dataplex
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_DB_NAME = "clouddq_configs.db"
+DEFAULT_ENTITY_URI_CACHE_DB_NAME = "clouddq_entity_uri_cache.db"
+ENTITY_URI_CACHE_TABLE = "entity_uri_cache"
+DATAPLEX_METADATA_MAX_WORKERS = 8
+SQLITE_MAX_QUERY_PARAMETERS = 500
+DATAPLEX_LOOKUP_REQUIRED_ARGUMENTS = ("projects", "lakes", "locations", "zones")
+
+
+class _LazyPformat:
+    """Defers pformat() of a log argument until the record is emitted."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: typing.Any):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return pformat(self.obj)
+
 
 @dataclass
 class DqConfigsCache:
     _cache_db: Database
 
-    def __init__(self, sqlite3_db_name: str | None = None):
+    def __init__(
+        self,
+        sqlite3_db_name: str | None = None,
+        entity_uri_cache_db_name: str = DEFAULT_ENTITY_URI_CACHE_DB_NAME,
+    ):
         if sqlite3_db_name:
             cache_db = Database(sqlite3.connect(sqlite3_db_name))
         else:
-            cache_db = Database("clouddq_configs.db", recreate=True)
+            cache_db = Database(DEFAULT_CACHE_DB_NAME, recreate=True)
+        # The configs cache is rebuilt from the YAML configs on every run,
+        # so trade durability for fewer fsyncs during the bulk loads
+        cache_db.enable_wal()
+        cache_db.execute("PRAGMA synchronous=NORMAL")
+        cache_db.execute("PRAGMA cache_size=-65536")
+        cache_db.execute("PRAGMA temp_store=MEMORY")
         self._cache_db = cache_db
+        # Resolved entity_uris are kept across runs in a separate db,
+        # which is only opened when 'metadata_cache_ttl' is set
+        self._entity_uri_cache_db_name = entity_uri_cache_db_name
+        self._entity_uri_cache_db: Database | None = None
+        # Configs are immutable once loaded, so memoize lookups by id.
+        # These are cleared whenever the underlying tables are written to.
+        self._entities_cache: dict[str, dq_entity.DqEntity] = {}
+        self._rules_cache: dict[str, dq_rule.DqRule] = {}
+        self._row_filters_cache: dict[str, dq_row_filter.DqRowFilter] = {}
+        self._rule_bindings_cache: dict[str, dq_rule_binding.DqRuleBinding] = {}
+
+    def clear_lookup_caches(self) -> None:
+        self._entities_cache.clear()
+        self._rules_cache.clear()
+        self._row_filters_cache.clear()
+        self._rule_bindings_cache.clear()
+
+    def get_entity_uri_cache_db(self) -> Database:
+        if self._entity_uri_cache_db is None:
+            cache_db = Database(self._entity_uri_cache_db_name)
+            if not cache_db[ENTITY_URI_CACHE_TABLE].exists():
+                cache_db[ENTITY_URI_CACHE_TABLE].create(
+                    {"uri": str, "resolved_json": str, "fetched_at": int}, pk="uri"
+                )
+            self._entity_uri_cache_db = cache_db
+        return self._entity_uri_cache_db
+
+    def clear_entity_uri_cache(self) -> None:
+        self.get_entity_uri_cache_db()[ENTITY_URI_CACHE_TABLE].delete_where()
 
     def get_table_entity_id(self, entity_id: str) -> dq_entity.DqEntity:
         entity_id = entity_id.upper()
+        if entity_id in self._entities_cache:
+            return self._entities_cache[entity_id]
         try:
             logger.debug(
                 f"Attempting to get from configs cache table entity_id: {entity_id}"
@@ -66,10 +134,13 @@ class DqConfigsCache:
         convert_json_value_to_dict(entity_record, "environment_override")
         convert_json_value_to_dict(entity_record, "columns")
         entity = dq_entity.DqEntity.from_dict(entity_id, entity_record)
+        self._entities_cache[entity_id] = entity
         return entity
 
     def get_rule_id(self, rule_id: str) -> dq_rule.DqRule:
         rule_id = rule_id.upper()
+        if rule_id in self._rules_cache:
+            return self._copy_rule(self._rules_cache[rule_id])
         try:
             rule_record = self._cache_db["rules"].get(rule_id)
         except NotFoundError:
@@ -78,7 +149,14 @@ class DqConfigsCache:
             raise NotFoundError(error_message)
         convert_json_value_to_dict(rule_record, "params")
         rule = dq_rule.DqRule.from_dict(rule_id, rule_record)
-        return rule
+        self._rules_cache[rule_id] = rule
+        return self._copy_rule(rule)
+
+    @staticmethod
+    def _copy_rule(rule: dq_rule.DqRule) -> dq_rule.DqRule:
+        # DqRule.update_rule_binding_arguments() mutates params in-place
+        # for each rule binding, so never hand out the memoized instance
+        return replace(rule, params=deepcopy(rule.params))
 
     def get_rule_dimensions(self) -> dq_rule.DqRuleDimensions:
         try:
@@ -91,6 +169,8 @@ class DqConfigsCache:
 
     def get_row_filter_id(self, row_filter_id: str) -> dq_row_filter.DqRowFilter:
         row_filter_id = row_filter_id.upper()
+        if row_filter_id in self._row_filters_cache:
+            return self._row_filters_cache[row_filter_id]
         try:
             row_filter_record = self._cache_db["row_filters"].get(row_filter_id)
         except NotFoundError:
@@ -99,12 +179,15 @@ class DqConfigsCache:
         row_filter = dq_row_filter.DqRowFilter.from_dict(
             row_filter_id, row_filter_record
         )
+        self._row_filters_cache[row_filter_id] = row_filter
         return row_filter
 
     def get_rule_binding_id(
         self, rule_binding_id: str
     ) -> dq_rule_binding.DqRuleBinding:
         rule_binding_id = rule_binding_id.upper()
+        if rule_binding_id in self._rule_bindings_cache:
+            return self._rule_bindings_cache[rule_binding_id]
         try:
             rule_binding_record = self._cache_db["rule_bindings"].get(rule_binding_id)
         except NotFoundError:
@@ -115,52 +198,70 @@ class DqConfigsCache:
         rule_binding = dq_rule_binding.DqRuleBinding.from_dict(
             rule_binding_id, rule_binding_record
         )
+        self._rule_bindings_cache[rule_binding_id] = rule_binding
         return rule_binding
 
     def load_all_rule_bindings_collection(self, rule_binding_collection: dict) -> None:
         logger.debug(
-            f"Loading 'rule_bindings' configs into cache:\n{pformat(rule_binding_collection.keys())}"
+            "Loading 'rule_bindings' configs into cache:\n%s",
+            _LazyPformat(rule_binding_collection.keys()),
+        )
+        # Stream the rows into upsert_all rather than building a full list first
+        rule_bindings_rows = (
+            {**record, "entity_uri": record.get("entity_uri")}
+            for record in unnest_object_to_iter(rule_binding_collection)
         )
-        rule_bindings_rows = unnest_object_to_list(rule_binding_collection)
-        for record in rule_bindings_rows:
-            if "entity_uri" not in record:
-                record.update({"entity_uri": None})
         self._cache_db["rule_bindings"].upsert_all(rule_bindings_rows, pk="id")
+        # Covering index for the entity_uri scan in resolve_dataplex_entity_uris.
+        # upsert_all does not create the table for an empty collection.
+        if self._cache_db["rule_bindings"].exists():
+            self._cache_db["rule_bindings"].create_index(
+                ["entity_uri", "id"], if_not_exists=True
+            )
+        self.clear_lookup_caches()
 
     def load_all_entities_collection(self, entities_collection: dict) -> None:
         logger.debug(
-            f"Loading 'entities' configs into cache:\n{pformat(entities_collection.keys())}"
+            "Loading 'entities' configs into cache:\n%s",
+            _LazyPformat(entities_collection.keys()),
         )
         self._cache_db["entities"].upsert_all(
-            unnest_object_to_list(entities_collection), pk="id"
+            unnest_object_to_iter(entities_collection), pk="id"
         )
+        self.clear_lookup_caches()
 
     def load_all_row_filters_collection(self, row_filters_collection: dict) -> None:
         logger.debug(
-            f"Loading 'row_filters' configs into cache:\n{pformat(row_filters_collection.keys())}"
+            "Loading 'row_filters' configs into cache:\n%s",
+            _LazyPformat(row_filters_collection.keys()),
         )
         self._cache_db["row_filters"].upsert_all(
-            unnest_object_to_list(row_filters_collection), pk="id"
+            unnest_object_to_iter(row_filters_collection), pk="id"
         )
+        self.clear_lookup_caches()
 
     def load_all_rules_collection(self, rules_collection: dict) -> None:
         logger.debug(
-            f"Loading 'rules' configs into cache:\n{pformat(rules_collection.keys())}"
+            "Loading 'rules' configs into cache:\n%s",
+            _LazyPformat(rules_collection.keys()),
         )
         self._cache_db["rules"].upsert_all(
-            unnest_object_to_list(rules_collection), pk="id"
+            unnest_object_to_iter(rules_collection), pk="id"
         )
+        self.clear_lookup_caches()
 
     def load_all_rule_dimensions_collection(
         self, rule_dimensions_collection: list
     ) -> None:
         logger.debug(
-            f"Loading 'rule_dimensions' configs into cache:\n{pformat(rule_dimensions_collection)}"
+            "Loading 'rule_dimensions' configs into cache:\n%s",
+            _LazyPformat(rule_dimensions_collection),
         )
         self._cache_db["rule_dimensions"].upsert_all(
             [{"rule_dimension": dim} for dim in rule_dimensions_collection],
             pk="rule_dimension",
         )
+        self.clear_lookup_caches()
 
     def resolve_dataplex_entity_uris(
         self,
@@ -168,109 +269,241 @@ class DqConfigsCache:
         default_configs: dict | None = None,
         target_rule_binding_ids: list[str] = None,
         enable_experimental_bigquery_entity_uris: bool = True,
+        max_workers: int = DATAPLEX_METADATA_MAX_WORKERS,
+        metadata_cache_ttl: int = 0,
     ) -> None:
         if not target_rule_binding_ids:
             target_rule_binding_ids = ["ALL"]
+        # Entity_uris resolved less than 'metadata_cache_ttl' seconds ago
+        # are read from 'entity_uri_cache' instead of the Dataplex Metadata API
+        use_entity_uri_cache = metadata_cache_ttl > 0
+        min_fetched_at = int(time.time()) - metadata_cache_ttl
+        resolved_entities = {}
         logger.debug(
-            f"Using Dataplex default configs for resolving entity_uris:\n{pformat(default_configs)}"
+            "Using Dataplex default configs for resolving entity_uris:\n%s",
+            _LazyPformat(default_configs),
         )
-        for record in self._cache_db.query(
-            "select distinct entity_uri, id from rule_bindings where entity_uri is not null"
-        ):
-            if (
-                target_rule_binding_ids[0] == "ALL"
-                or record["id"] in target_rule_binding_ids  # noqa: W503
+        # Dataplex Metadata API calls are network-bound, so fan them out
+        # across a thread pool and write the results back on this thread
+        # (the sqlite connection must only be used by the thread that created it)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            submitted_cache_keys = set()
+            for uri_string, rule_binding_id in self._query_rule_binding_entity_uris(
+                target_rule_binding_ids
             ):
-                logger.info(
-                    f"Calling Dataplex Metadata list entities API to retrieve schema "
-                    f"for entity_uri:\n{pformat(record)}"
-                )
                 entity_uri = dq_entity_uri.EntityUri.from_uri(
-                    uri_string=record["entity_uri"],
+                    uri_string=uri_string,
                     default_configs=default_configs,
                 )
-                logger.debug(
-                    f"Parsed entity_uri configs:\n{pformat(entity_uri.to_dict())}"
-                )
-                if entity_uri.scheme == "dataplex":
-                    dataplex_entity = client.get_dataplex_entity(
-                        gcp_project_id=entity_uri.get_configs("projects"),
-                        location_id=entity_uri.get_configs("locations"),
-                        lake_name=entity_uri.get_configs("lakes"),
-                        zone_id=entity_uri.get_configs("zones"),
-                        entity_id=entity_uri.get_entity_id(),
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Parsed entity_uri configs:\n%s",
+                        _LazyPformat(entity_uri.to_dict()),
                     )
-                    clouddq_entity = dq_entity.DqEntity.from_dataplex_entity(
-                        entity_id=entity_uri.get_db_primary_key(),
-                        dataplex_entity=dataplex_entity,
-                    ).to_dict()
-                    resolved_entity = unnest_object_to_list(clouddq_entity)
-                elif entity_uri.scheme == "bigquery":
-                    if not enable_experimental_bigquery_entity_uris:
-                        raise NotImplementedError(
-                            f"entity_uri '{entity_uri.complete_uri_string}' "
-                            f"in rule_binding id '{record['id']}' "
-                            "has unsupported scheme 'bigquery://'.\n"
-                            "Use CLI flag --enable_experimental_bigquery_entity_uris "
-                            "to enable looking up bigquery:// entity_uri scheme in format "
-                            "bigquery://projects/<project-id>/datasets/<dataset-id>/tables/<table-id> "
-                            "schemes using Dataplex Metadata API.\n"
-                            "Ensure the BigQuery dataset containing this table "
-                            "is registered as an asset in Dataplex.\n"
-                            "You can then specify the corresponding Dataplex "
-                            "projects/locations/lakes/zones as part of the "
-                            "metadata_default_registries YAML configs, e.g.\n"
-                            f"{SAMPLE_DEFAULT_REGISTRIES_YAML}"
-                        )
-                    required_arguments = ["projects", "lakes", "locations", "zones"]
-                    for argument in required_arguments:
-                        uri_argument = entity_uri.get_configs(argument)
-                        if not uri_argument:
-                            raise RuntimeError(
-                                f"Failed to retrieve default Dataplex '{argument}' for "
-                                f"entity_uri: {entity_uri.complete_uri_string}. \n"
-                                f"'{argument}' is a required argument to look-up metadata for the entity_uri "
-                                "using Dataplex Metadata API.\n"
-                                "Ensure the BigQuery dataset containing this table "
-                                "is registered as an asset in Dataplex.\n"
-                                "You can then specify the corresponding Dataplex "
-                                "projects/locations/lakes/zones as part of the "
-                                "metadata_default_registries YAML configs, e.g.\n"
-                                f"{SAMPLE_DEFAULT_REGISTRIES_YAML}"
-                            )
-                    dataplex_entities_match = client.list_dataplex_entities(
-                        gcp_project_id=entity_uri.get_configs("projects"),
-                        location_id=entity_uri.get_configs("locations"),
-                        lake_name=entity_uri.get_configs("lakes"),
-                        zone_id=entity_uri.get_configs("zones"),
-                        data_path=entity_uri.get_entity_id(),
+                # Check the scheme before the cache lookup so that entity_uris
+                # cached by a run with different flags are still rejected
+                self._check_entity_uri_scheme_enabled(
+                    rule_binding_id=rule_binding_id,
+                    entity_uri=entity_uri,
+                    enable_experimental_bigquery_entity_uris=enable_experimental_bigquery_entity_uris,
+                )
+                cache_key = self._get_entity_uri_cache_key(entity_uri)
+                if cache_key in submitted_cache_keys:
+                    # Already being looked up for another rule binding
+                    continue
+                cached_entities = None
+                if use_entity_uri_cache:
+                    cached_entities = self._get_cached_entity_uri(
+                        cache_key, min_fetched_at
                     )
+                if cached_entities is not None:
                     logger.info(
-                        f"Retrieved Dataplex Entities:\n{pformat(dataplex_entities_match)}"
+                        f"Using cached Dataplex Metadata for entity_uri "
+                        f"'{uri_string}' in rule binding '{rule_binding_id}'"
+                    )
+                    for resolved_entity in cached_entities:
+                        resolved_entities[resolved_entity["id"]] = resolved_entity
+                    continue
+                logger.info(
+                    f"Calling Dataplex Metadata list entities API to retrieve schema "
+                    f"for entity_uri '{uri_string}' in rule binding '{rule_binding_id}'"
+                )
+                future = executor.submit(
+                    self._resolve_dataplex_entity_uri,
+                    client=client,
+                    rule_binding_id=rule_binding_id,
+                    entity_uri=entity_uri,
+                    default_configs=default_configs,
+                )
+                futures[future] = cache_key
+                submitted_cache_keys.add(cache_key)
+            # Several rule bindings can point at the same entity, so key the
+            # resolved rows by id and write them all in a single upsert
+            fetched_at = int(time.time())
+            entity_uri_cache_rows = []
+            for future in as_completed(futures):
+                fetched_entities = future.result()
+                for resolved_entity in fetched_entities:
+                    logger.debug(
+                        "Resolved Dataplex Entity to write to db: %s", resolved_entity
                     )
-                    if len(dataplex_entities_match) != 1:
-                        raise RuntimeError(
-                            "Failed to retrieve Dataplex Metadata entry for "
-                            f"entity_uri '{entity_uri.complete_uri_string}' in "
-                            f"Rule Binding ID '{record['id']}'\n\n"
-                            f"Parsed entity_uri configs:\n"
-                            f"{pformat(entity_uri.to_dict())}\n\n"
-                            f"Current Dataplex default configs from "
-                            f"'metadata_registry_defaults' YAML:\n"
-                            f"{pformat(default_configs)}\n\n"
-                            f"Ensure BigQuery entity exists in the correct Dataplex zone."
-                        )
-                    else:
-                        dataplex_entity = dataplex_entities_match[0]
-                        clouddq_entity = dq_entity.DqEntity.from_dataplex_entity(
-                            entity_id=entity_uri.get_db_primary_key(),
-                            dataplex_entity=dataplex_entity,
-                        ).to_dict()
-                    resolved_entity = unnest_object_to_list(clouddq_entity)
-                logger.debug(f"Writing parsed Dataplex Entity to db: {resolved_entity}")
-                self._cache_db["entities"].upsert_all(
-                    resolved_entity, pk="id", alter=True
+                    resolved_entities[resolved_entity["id"]] = resolved_entity
+                if use_entity_uri_cache:
+                    entity_uri_cache_rows.append(
+                        {
+                            "uri": futures[future],
+                            "resolved_json": json.dumps(fetched_entities),
+                            "fetched_at": fetched_at,
+                        }
+                    )
+        if entity_uri_cache_rows:
+            self.get_entity_uri_cache_db()[ENTITY_URI_CACHE_TABLE].upsert_all(
+                entity_uri_cache_rows, pk="uri"
+            )
+        if resolved_entities:
+            self._cache_db["entities"].upsert_all(
+                resolved_entities.values(), pk="id", alter=True
+            )
+            self.clear_lookup_caches()
+
+    @staticmethod
+    def _get_entity_uri_cache_key(entity_uri: dq_entity_uri.EntityUri) -> str:
+        # The resolved entity depends on the metadata registry defaults
+        # as well as on the entity_uri itself, so key on all of the configs
+        configs = "/".join(
+            f"{key}/{value}" for key, value in sorted(entity_uri.configs_dict.items())
+        )
+        return f"{entity_uri.scheme.value}://{configs}"
+
+    def _get_cached_entity_uri(
+        self, cache_key: str, min_fetched_at: int
+    ) -> list | None:
+        entity_uri_cache_db = self.get_entity_uri_cache_db()
+        row = entity_uri_cache_db.conn.execute(
+            f"select resolved_json, fetched_at from {ENTITY_URI_CACHE_TABLE} "
+            "where uri = ?",
+            [cache_key],
+        ).fetchone()
+        if row is None or row[1] <= min_fetched_at:
+            return None
+        return json.loads(row[0])
+
+    def _query_rule_binding_entity_uris(
+        self, target_rule_binding_ids: list[str]
+    ) -> typing.Iterator[tuple[str, str]]:
+        # Use the raw sqlite3 cursor: only two columns are needed, so skip
+        # sqlite_utils' per-row dict construction. sqlite3 also keeps the
+        # compiled statements in its per-connection statement cache.
+        query = "select distinct entity_uri, id from rule_bindings where entity_uri is not null"
+        if target_rule_binding_ids[0] == "ALL":
+            yield from self._cache_db.conn.execute(query)
+            return
+        # Filter in SQL rather than fetching every row and discarding most of them.
+        # Chunk the ids to stay under SQLITE_MAX_VARIABLE_NUMBER on older sqlite builds.
+        target_ids = list(dict.fromkeys(target_rule_binding_ids))
+        for i in range(0, len(target_ids), SQLITE_MAX_QUERY_PARAMETERS):
+            ids_chunk = target_ids[i : i + SQLITE_MAX_QUERY_PARAMETERS]
+            placeholders = ", ".join("?" * len(ids_chunk))
+            yield from self._cache_db.conn.execute(
+                f"{query} and id in ({placeholders})", ids_chunk
+            )
+
+    @staticmethod
+    def _check_entity_uri_scheme_enabled(
+        rule_binding_id: str,
+        entity_uri: dq_entity_uri.EntityUri,
+        enable_experimental_bigquery_entity_uris: bool = True,
+    ) -> None:
+        if (
+            entity_uri.scheme == "bigquery"
+            and not enable_experimental_bigquery_entity_uris
+        ):
+            raise NotImplementedError(
+                f"entity_uri '{entity_uri.complete_uri_string}' "
+                f"in rule_binding id '{rule_binding_id}' "
+                "has unsupported scheme 'bigquery://'.\n"
+                "Use CLI flag --enable_experimental_bigquery_entity_uris "
+                "to enable looking up bigquery:// entity_uri scheme in format "
+                "bigquery://projects/<project-id>/datasets/<dataset-id>/tables/<table-id> "
+                "schemes using Dataplex Metadata API.\n"
+                "Ensure the BigQuery dataset containing this table "
+                "is registered as an asset in Dataplex.\n"
+                "You can then specify the corresponding Dataplex "
+                "projects/locations/lakes/zones as part of the "
+                "metadata_default_registries YAML configs, e.g.\n"
+                f"{SAMPLE_DEFAULT_REGISTRIES_YAML}"
+            )
+
+    @staticmethod
+    def _resolve_dataplex_entity_uri(
+        client: clouddq_dataplex.CloudDqDataplexClient,
+        rule_binding_id: str,
+        entity_uri: dq_entity_uri.EntityUri,
+        default_configs: dict | None = None,
+    ) -> list:
+        if entity_uri.scheme == "dataplex":
+            dataplex_entity = client.get_dataplex_entity(
+                gcp_project_id=entity_uri.get_configs("projects"),
+                location_id=entity_uri.get_configs("locations"),
+                lake_name=entity_uri.get_configs("lakes"),
+                zone_id=entity_uri.get_configs("zones"),
+                entity_id=entity_uri.get_entity_id(),
+            )
+            clouddq_entity = dq_entity.DqEntity.from_dataplex_entity(
+                entity_id=entity_uri.get_db_primary_key(),
+                dataplex_entity=dataplex_entity,
+            ).to_dict()
+        elif entity_uri.scheme == "bigquery":
+            configs = entity_uri.configs_dict
+            missing_arguments = [
+                argument
+                for argument in DATAPLEX_LOOKUP_REQUIRED_ARGUMENTS
+                if not configs.get(argument)
+            ]
+            if missing_arguments:
+                raise RuntimeError(
+                    f"Failed to retrieve default Dataplex {missing_arguments} for "
+                    f"entity_uri: {entity_uri.complete_uri_string}. \n"
+                    f"{missing_arguments} are required arguments to look-up metadata for the entity_uri "
+                    "using Dataplex Metadata API.\n"
+                    "Ensure the BigQuery dataset containing this table "
+                    "is registered as an asset in Dataplex.\n"
+                    "You can then specify the corresponding Dataplex "
+                    "projects/locations/lakes/zones as part of the "
+                    "metadata_default_registries YAML configs, e.g.\n"
+                    f"{SAMPLE_DEFAULT_REGISTRIES_YAML}"
+                )
+            dataplex_entities_match = client.list_dataplex_entities(
+                gcp_project_id=configs["projects"],
+                location_id=configs["locations"],
+                lake_name=configs["lakes"],
+                zone_id=configs["zones"],
+                data_path=entity_uri.get_entity_id(),
+            )
+            logger.info(
+                "Retrieved Dataplex Entities:\n%s",
+                _LazyPformat(dataplex_entities_match),
+            )
+            if len(dataplex_entities_match) != 1:
+                raise RuntimeError(
+                    "Failed to retrieve Dataplex Metadata entry for "
+                    f"entity_uri '{entity_uri.complete_uri_string}' in "
+                    f"Rule Binding ID '{rule_binding_id}'\n\n"
+                    f"Parsed entity_uri configs:\n"
+                    f"{pformat(entity_uri.to_dict())}\n\n"
+                    f"Current Dataplex default configs from "
+                    f"'metadata_registry_defaults' YAML:\n"
+                    f"{pformat(default_configs)}\n\n"
+                    f"Ensure BigQuery entity exists in the correct Dataplex zone."
                 )
+            else:
+                dataplex_entity = dataplex_entities_match[0]
+                clouddq_entity = dq_entity.DqEntity.from_dataplex_entity(
+                    entity_id=entity_uri.get_db_primary_key(),
+                    dataplex_entity=dataplex_entity,
+                ).to_dict()
+        return unnest_object_to_list(clouddq_entity)
 
     def update_config(
         configs_type: str, config_old: list | dict, config_new: list | dict
@@ -15,8 +15,11 @@
 """todo: add classes docstring."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
+import functools
 import logging
 import re
 import typing
@@ -27,53 +30,90 @@ from clouddq.classes.metadata_registry_defaults import DATAPLEX_URI_FIELDS
 from clouddq.classes.metadata_registry_defaults import SAMPLE_DEFAULT_REGISTRIES_YAML
 
 
-UNSUPPORTED_URI_CONFIGS = re.compile("[@#?:]")
+UNSUPPORTED_URI_CONFIGS = re.compile("[*@#?:]")
+ENTITY_URI_CACHE_SIZE = 1024
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class EntityUri:
-    """ """
+    """Parsed entity_uri.
+
+    Instances returned by from_uri are cached and shared between callers,
+    so the class is frozen and its configs are exposed as read-only mappings.
+    """
+
+    __slots__ = (
+        "scheme",
+        "uri_configs_string",
+        "default_configs",
+        "_configs_dict",
+        "_entity_id",
+        "_db_primary_key",
+    )
 
     scheme: EntityUriScheme
     uri_configs_string: str
-    default_configs: dict
+    default_configs: Mapping | None
+
+    def __post_init__(self: EntityUri) -> None:
+        entity_uri_list = self.uri_configs_string.split("/")
+        all_configs: dict[str, str] = {}
+        if self.default_configs and isinstance(self.default_configs, Mapping):
+            all_configs.update(self.default_configs)
+        all_configs.update(zip(entity_uri_list[::2], entity_uri_list[1::2]))
+        if self.scheme == EntityUriScheme.DATAPLEX:
+            db_primary_key = (
+                f"projects/{all_configs.get('projects')}/"
+                f"locations/{all_configs.get('locations')}/"
+                f"lakes/{all_configs.get('lakes')}/"
+                f"zones/{all_configs.get('zones')}/"
+                f"entities/{all_configs.get('entities')}"
+            )
+            entity_id = all_configs.get("entities")
+        elif self.scheme == EntityUriScheme.BIGQUERY:
+            db_primary_key = (
+                f"projects/{all_configs.get('projects')}/"
+                f"datasets/{all_configs.get('datasets')}/"
+                f"tables/{all_configs.get('tables')}"
+            )
+            entity_id = db_primary_key
+        else:
+            db_primary_key = None
+            entity_id = None
+        # The dataclass is frozen, so derived fields bypass its __setattr__
+        object.__setattr__(self, "_configs_dict", MappingProxyType(all_configs))
+        object.__setattr__(self, "_db_primary_key", db_primary_key)
+        object.__setattr__(self, "_entity_id", entity_id)
 
     @property
     def complete_uri_string(self: EntityUri) -> str:
         return f"{self.scheme.value}://{self.uri_configs_string}"
 
     @property
-    def configs_dict(self: EntityUri) -> dict:
-        entity_uri_list = self.uri_configs_string.split("/")
-        all_configs = {}
-        if self.default_configs and type(self.default_configs) == dict:
-            all_configs.update(self.default_configs)
-        uri_dict = dict(zip(entity_uri_list[::2], entity_uri_list[1::2]))
-        all_configs.update(uri_dict)
-        return all_configs
+    def configs_dict(self: EntityUri) -> Mapping:
+        return self._configs_dict
 
     def get_configs(self: EntityUri, configs_key: str) -> typing.Any:
-        configs_dict = self.configs_dict
-        return configs_dict.get(configs_key)
+        return self._configs_dict.get(configs_key)
 
     @classmethod
     def from_uri(
-        cls: EntityUri, uri_string: str, default_configs: dict | None = None
+        cls: EntityUri, uri_string: str, default_configs: Mapping | None = None
     ) -> EntityUri:
-        uri_scheme, uri_configs_string = uri_string.split("://")
-        scheme = EntityUriScheme.from_scheme(uri_scheme)
-        default_scheme_configs = None
-        if default_configs:
-            default_scheme_configs = default_configs
-        entity_uri = EntityUri(
-            scheme=scheme,
-            uri_configs_string=uri_configs_string,
-            default_configs=default_scheme_configs,
-        )
-        entity_uri.validate()
-        return entity_uri
+        if not default_configs or not isinstance(default_configs, Mapping):
+            return _parse_entity_uri_cached(uri_string, None)
+        try:
+            default_configs_key = tuple(sorted(default_configs.items()))
+            hash(default_configs_key)
+        except TypeError:
+            # Default configs that cannot be sorted or hashed cannot key
+            # the cache, so parse the entity_uri without caching it
+            return _parse_entity_uri(
+                uri_string, MappingProxyType(dict(default_configs))
+            )
+        return _parse_entity_uri_cached(uri_string, default_configs_key)
 
     def to_dict(self: EntityUri) -> dict:
         return {
@@ -81,18 +121,19 @@ class EntityUri:
             "scheme": self.scheme.value,
             "entity_id": self.get_entity_id(),
             "db_primary_key": self.get_db_primary_key(),
-            "configs": self.configs_dict,
+            "configs": dict(self._configs_dict),
         }
 
     def validate(self: EntityUri) -> None:
-        configs = self.configs_dict
-        if "*" in self.uri_configs_string:
-            raise NotImplementedError(
-                f"EntityUri: '{self.complete_uri_string}' "
-                f"does not yet support wildcard character: '*'."
-            )
+        configs = self._configs_dict
+        # Check for wildcards and unsupported characters in a single pass
         unsupported_configs = UNSUPPORTED_URI_CONFIGS.search(self.uri_configs_string)
         if unsupported_configs:
+            if "*" in self.uri_configs_string:
+                raise NotImplementedError(
+                    f"EntityUri: '{self.complete_uri_string}' "
+                    f"does not yet support wildcard character: '*'."
+                )
             raise ValueError(
                 f"EntityUri: '{self.complete_uri_string}' "
                 f"contains unsupported entity_uri character: '{unsupported_configs.group(0)}'."
@@ -115,38 +156,24 @@ class EntityUri:
         assert "None" not in self.get_entity_id()
 
     def get_entity_id(self: EntityUri) -> str:
-        if self.scheme == EntityUriScheme.DATAPLEX:
-            return self.get_configs("entities")
-        elif self.scheme == EntityUriScheme.BIGQUERY:
-            return self.get_db_primary_key()
-        else:
+        if self._db_primary_key is None:
             raise NotImplementedError(
                 f"EntityUri.get_entity_id() for scheme '{self.scheme}' "
                 f"is not yet supported in entity_uri '{self.complete_uri_string}'."
             )
+        return self._entity_id
 
-    def get_db_primary_key(self) -> str:
-        if self.scheme == EntityUriScheme.DATAPLEX:
-            return (
-                f"projects/{self.get_configs('projects')}/"
-                f"locations/{self.get_configs('locations')}/"
-                f"lakes/{self.get_configs('lakes')}/"
-                f"zones/{self.get_configs('zones')}/"
-                f"entities/{self.get_configs('entities')}"
-            )
-        elif self.scheme == EntityUriScheme.BIGQUERY:
-            return (
-                f"projects/{self.get_configs('projects')}/"
-                f"datasets/{self.get_configs('datasets')}/"
-                f"tables/{self.get_configs('tables')}"
-            )
-        else:
+    def get_db_primary_key(self: EntityUri) -> str:
+        if self._db_primary_key is None:
             raise NotImplementedError(
                 f"EntityUri.get_db_primary_key() for scheme '{self.scheme}' "
                 f"is not yet supported in entity_uri '{self.complete_uri_string}'."
             )
+        return self._db_primary_key
 
-    def _validate_dataplex_uri_fields(self, config_id: str, configs: dict) -> None:
+    def _validate_dataplex_uri_fields(
+        self: EntityUri, config_id: str, configs: dict
+    ) -> None:
         expected_fields = DATAPLEX_URI_FIELDS
         for field in expected_fields:
             value = configs.get(field, None)
@@ -159,7 +186,9 @@ class EntityUri:
                     f"{SAMPLE_DEFAULT_REGISTRIES_YAML}"
                 )
 
-    def _validate_bigquery_uri_fields(self, config_id: str, configs: dict) -> None:
+    def _validate_bigquery_uri_fields(
+        self: EntityUri, config_id: str, configs: dict
+    ) -> None:
         expected_fields = BIGQUERY_URI_FIELDS
         for field in expected_fields:
             value = configs.get(field, None)
@@ -172,3 +201,30 @@ class EntityUri:
                     f"input config under headings 'metadata_default_registries', e.g.\n"
                     f"{SAMPLE_DEFAULT_REGISTRIES_YAML}",
                 )
+
+
+@functools.lru_cache(maxsize=ENTITY_URI_CACHE_SIZE)
+def _parse_entity_uri_cached(
+    uri_string: str, default_configs_key: tuple[tuple[str, typing.Any], ...] | None
+) -> EntityUri:
+    default_configs = None
+    if default_configs_key:
+        default_configs = MappingProxyType(dict(default_configs_key))
+    return _parse_entity_uri(uri_string, default_configs)
+
+
+def _parse_entity_uri(uri_string: str, default_configs: Mapping | None) -> EntityUri:
+    uri_scheme, separator, uri_configs_string = uri_string.partition("://")
+    if not separator:
+        raise ValueError(
+            f"EntityUri: '{uri_string}' must be in the format "
+            f"'<scheme>://<entity_uri_configs>'."
+        )
+    scheme = EntityUriScheme.from_scheme(uri_scheme)
+    entity_uri = EntityUri(
+        scheme=scheme,
+        uri_configs_string=uri_configs_string,
+        default_configs=default_configs,
+    )
+    entity_uri.validate()
+    return entity_uri
@@ -48,7 +48,7 @@ FROM (
 """
 )
 
-RE_EXTRACT_TABLE_NAME = ".*Not found: Table (.+?) was not found in.*"
+RE_EXTRACT_TABLE_NAME = re.compile(".*Not found: Table (.+?) was not found in.*")
 
 
 class BigQueryClient:
@@ -118,7 +118,7 @@ class BigQueryClient:
                 )
             )
         except NotFound as e:
-            table_name = re.search(RE_EXTRACT_TABLE_NAME, str(e))
+            table_name = RE_EXTRACT_TABLE_NAME.search(str(e))
             if table_name:
                 table_name = table_name.group(1).replace(":", ".")
                 raise AssertionError(f"Table name `{table_name}` does not exist.")
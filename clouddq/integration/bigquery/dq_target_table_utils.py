@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 from datetime import date
 
 import json
@@ -34,6 +36,15 @@ def log_summary(summary_data: RowIterator):
         json_logger.info(json.dumps(data, default=str))
 
 
+def get_summary_query_parameters(
+    invocation_id: str, partition_date: date
+) -> list[bigquery.ScalarQueryParameter]:
+    return [
+        bigquery.ScalarQueryParameter("invocation_id", "STRING", invocation_id),
+        bigquery.ScalarQueryParameter("partition_date", "DATE", partition_date),
+    ]
+
+
 def load_target_table_from_bigquery(
     bigquery_client: BigQueryClient,
     invocation_id: str,
@@ -43,6 +54,8 @@ def load_target_table_from_bigquery(
     summary_to_stdout: bool = False,
 ):
 
+    query_parameters = get_summary_query_parameters(invocation_id, partition_date)
+
     if bigquery_client.is_table_exists(target_bigquery_summary_table):
 
         job_config = bigquery.QueryJobConfig(
@@ -50,14 +63,15 @@ def load_target_table_from_bigquery(
             write_disposition="WRITE_APPEND",
             use_query_cache=False,
             use_legacy_sql=False,
+            query_parameters=query_parameters,
         )
 
         query_string = f"""SELECT * FROM `{dq_summary_table_name}`
-         WHERE invocation_id='{invocation_id}'
-         and DATE(execution_ts)='{partition_date}'"""
+         WHERE invocation_id=@invocation_id
+         and DATE(execution_ts)=@partition_date"""
 
         # Start the query, passing in the extra configuration.
-        # Make an API request and wait for the job to complete
+        # Make an API request and wait for the job to complete.
         summary_data = bigquery_client.execute_query(
             query_string=query_string, job_config=job_config
         ).result()
@@ -71,8 +85,8 @@ def load_target_table_from_bigquery(
     else:
 
         query_select = f"""SELECT * from `{dq_summary_table_name}`
-        WHERE invocation_id='{invocation_id}'
-        AND DATE(execution_ts)='{partition_date}'"""
+        WHERE invocation_id=@invocation_id
+        AND DATE(execution_ts)=@partition_date"""
 
         query_create_table = f"""CREATE TABLE
         `{target_bigquery_summary_table}`
@@ -80,12 +94,30 @@ def load_target_table_from_bigquery(
         CLUSTER BY table_id, column_id, rule_binding_id, rule_id
         AS {query_select}"""
 
-        # Run the SELECT to get the summary data
-        summary_data = bigquery_client.execute_query(query_string=query_select).result()
-        # Now create the summary table
-        bigquery_client.execute_query(query_string=query_create_table).result()
+        job_config = bigquery.QueryJobConfig(
+            use_query_cache=False,
+            use_legacy_sql=False,
+            query_parameters=query_parameters,
+        )
+
+        # Create the summary table
+        bigquery_client.execute_query(
+            query_string=query_create_table, job_config=job_config
+        ).result()
 
         if summary_to_stdout:
+            # Read the summary data back from the new table rather than
+            # scanning the dq summary table a second time
+            query_logged_summary = f"""SELECT * from `{target_bigquery_summary_table}`
+            WHERE invocation_id=@invocation_id
+            AND DATE(execution_ts)=@partition_date"""
+            summary_data = bigquery_client.execute_query(
+                query_string=query_logged_summary,
+                job_config=bigquery.QueryJobConfig(
+                    use_legacy_sql=False,
+                    query_parameters=query_parameters,
+                ),
+            ).result()
             log_summary(summary_data)
         logger.info(
             f"Table created and dq summary results loaded to the "
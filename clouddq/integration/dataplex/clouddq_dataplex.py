@@ -13,13 +13,13 @@
 # limitations under the License.
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
+from typing import Iterator
 
-import json
 import logging
 import re
-import time
 
 from requests import Response
 
@@ -27,8 +27,8 @@ from clouddq.classes.dataplex_entity import DataplexEntity
 from clouddq.integration.dataplex.dataplex_client import DataplexClient
 from clouddq.integration.gcp_credentials import GcpCredentials
 from clouddq.integration.gcs import upload_blob
+from clouddq.utils import TokenBucket
 from clouddq.utils import exponential_backoff
-from clouddq.utils import update_dict
 
 
 logger = logging.getLogger(__name__)
@@ -36,7 +36,28 @@ TARGET_SCOPES = [
     "https://www.googleapis.com/auth/cloud-platform",
 ]
 USER_AGENT_TAG = "Product_Dataplex/1.0 (GPN:Dataplex_CloudDQ)"
+# Task labels only allow lowercase letters, numbers and dashes
+ALLOWED_USER_AGENT_LABEL = re.sub("[^0-9a-zA-Z]+", "-", USER_AGENT_TAG.lower())
 DEFAULT_GCS_BUCKET_NAME = "dataplex-clouddq-artifacts-{gcp_dataplex_region}"
+CLOUDDQ_EXECUTION_ARGUMENTS_TEMPLATE = (
+    "clouddq-executable.zip, "
+    "ALL, "
+    "{clouddq_configs_gcs_path}, "
+    '--gcp_project_id="{clouddq_run_project_id}", '
+    '--gcp_region_id="{clouddq_run_bq_region}", '
+    '--gcp_bq_dataset_id="{clouddq_run_bq_dataset}", '
+    "--target_bigquery_summary_table="
+    '"{target_bq_result_project_name}.'
+    "{target_bq_result_dataset_name}."
+    '{target_bq_result_table_name}",'
+)
+DATAPLEX_ENTITY_MAX_WORKERS = 16
+# Dataplex Metadata API quota for list entities calls
+DATAPLEX_LIST_ENTITIES_RATE = 4
+DATAPLEX_LIST_ENTITIES_PER_SECONDS = 10.0
+# Cap the get entity fan-out well below the Dataplex Metadata API read quota
+DATAPLEX_GET_ENTITY_RATE = 20
+DATAPLEX_GET_ENTITY_PER_SECONDS = 1.0
 
 
 class DATAPLEX_TASK_TRIGGER_TYPE(str, Enum):
@@ -46,6 +67,9 @@ class DATAPLEX_TASK_TRIGGER_TYPE(str, Enum):
 
 class CloudDqDataplexClient:
     _client: DataplexClient
+    _list_entities_rate_limiter: TokenBucket
+    _get_entity_rate_limiter: TokenBucket
+    _entity_lookup_executor: ThreadPoolExecutor
     gcs_bucket_name: str
 
     def __init__(
@@ -70,6 +94,31 @@ class CloudDqDataplexClient:
             gcp_dataplex_region=gcp_dataplex_region,
             dataplex_endpoint=dataplex_endpoint,
         )
+        # No bursts for list entities, so that no 10 second window
+        # ever sees more than DATAPLEX_LIST_ENTITIES_RATE calls
+        self._list_entities_rate_limiter = TokenBucket(
+            rate=DATAPLEX_LIST_ENTITIES_RATE,
+            per=DATAPLEX_LIST_ENTITIES_PER_SECONDS,
+            burst=1,
+        )
+        self._get_entity_rate_limiter = TokenBucket(
+            rate=DATAPLEX_GET_ENTITY_RATE, per=DATAPLEX_GET_ENTITY_PER_SECONDS
+        )
+        # Shared by every list_dataplex_entities call, including concurrent ones,
+        # so the total number of in-flight get entity calls stays bounded
+        self._entity_lookup_executor = ThreadPoolExecutor(
+            max_workers=DATAPLEX_ENTITY_MAX_WORKERS
+        )
+
+    def close(self) -> None:
+        self._entity_lookup_executor.shutdown(wait=True)
+        self._client.close()
+
+    def __enter__(self) -> CloudDqDataplexClient:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
 
     def create_clouddq_task(  # noqa: C901
         self,
@@ -106,7 +155,7 @@ class CloudDqDataplexClient:
         )
         # Prepare input CloudDQ YAML specs path
         clouddq_yaml_spec_file_path = str(clouddq_yaml_spec_file_path)
-        if clouddq_yaml_spec_file_path[:5] == "gs://":
+        if clouddq_yaml_spec_file_path.startswith("gs://"):
             clouddq_configs_gcs_path = clouddq_yaml_spec_file_path
         else:
             clouddq_yaml_spec_file_path = Path(clouddq_yaml_spec_file_path)
@@ -128,23 +177,16 @@ class CloudDqDataplexClient:
                     "or a GCS path to the `.yml` or `.zip` configs file."
                 )
         # Add user-agent tag as Task label
-        allowed_user_agent_label = re.sub("[^0-9a-zA-Z]+", "-", USER_AGENT_TAG.lower())
-        if task_labels:
-            task_labels["user-agent"] = allowed_user_agent_label
-        else:
-            task_labels = {"user-agent": allowed_user_agent_label}
+        task_labels = {**(task_labels or {}), "user-agent": ALLOWED_USER_AGENT_LABEL}
         # Prepare CloudDQ execution argumnets
-        execution_arguments = (
-            f"clouddq-executable.zip, "
-            "ALL, "
-            f"{clouddq_configs_gcs_path}, "
-            f'--gcp_project_id="{clouddq_run_project_id}", '
-            f'--gcp_region_id="{clouddq_run_bq_region}", '
-            f'--gcp_bq_dataset_id="{clouddq_run_bq_dataset}", '
-            f"--target_bigquery_summary_table="
-            f'"{target_bq_result_project_name}.'
-            f"{target_bq_result_dataset_name}."
-            f'{target_bq_result_table_name}",'
+        execution_arguments = CLOUDDQ_EXECUTION_ARGUMENTS_TEMPLATE.format(
+            clouddq_configs_gcs_path=clouddq_configs_gcs_path,
+            clouddq_run_project_id=clouddq_run_project_id,
+            clouddq_run_bq_region=clouddq_run_bq_region,
+            clouddq_run_bq_dataset=clouddq_run_bq_dataset,
+            target_bq_result_project_name=target_bq_result_project_name,
+            target_bq_result_dataset_name=target_bq_result_dataset_name,
+            target_bq_result_table_name=target_bq_result_table_name,
         )
         # Set experimental flags
         if enable_experimental_bigquery_entity_uris:
@@ -187,9 +229,10 @@ class CloudDqDataplexClient:
         :return: Task status
         """
         res = self._client.get_dataplex_task_jobs(task_id)
-        logger.info(f"Response status code is {res.status_code}")
-        logger.info(f"Response text is {res.text}")
-        resp_obj = json.loads(res.text)
+        logger.info("Response status code is %s", res.status_code)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response text is %s", res.text)
+        resp_obj = res.json()
 
         if res.status_code == 200:
 
@@ -257,8 +300,8 @@ class CloudDqDataplexClient:
             clouddq_artifact_gcs_path = f"gs://{self.gcs_bucket_name}/{artifact_name}"
         else:
             clouddq_artifact_path = str(clouddq_artifact_path)
-            clouddq_artifact_name = clouddq_artifact_path.split("/")[-1]
-            if not clouddq_artifact_path[:5] == "gs://":
+            clouddq_artifact_name = clouddq_artifact_path.rsplit("/", 1)[-1]
+            if not clouddq_artifact_path.startswith("gs://"):
                 raise ValueError(
                     f"Artifact path argument for {artifact_name}: "
                     f"{clouddq_artifact_path} must be a GCS path."
@@ -280,8 +323,12 @@ class CloudDqDataplexClient:
         location_id: str = None,
         lake_name: str = None,
     ) -> DataplexEntity:
-        logger.debug(f"CloudDqDataplex.get_dataplex_entity() arguments: {locals()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "CloudDqDataplex.get_dataplex_entity() arguments: %s", locals()
+            )
         params = {"view": "FULL"}
+        self._get_entity_rate_limiter.acquire()
         response = self._client.get_entity(
             zone_id=zone_id,
             entity_id=entity_id,
@@ -291,7 +338,7 @@ class CloudDqDataplexClient:
             params=params,
         )
         if response.status_code == 200:
-            return DataplexEntity.from_dict(json.loads(response.text))
+            return DataplexEntity.from_dict(response.json())
         else:
             raise RuntimeError(
                 f"Failed to retrieve Dataplex entity: "
@@ -299,7 +346,7 @@ class CloudDqDataplexClient:
                 f"/lakes/{self._client.lake_name}/zones/{zone_id}/entities/{entity_id}':\n {response.text}"
             )
 
-    def list_dataplex_entities(
+    def _list_dataplex_entities_pages(
         self,
         zone_id: str,
         prefix: str = None,
@@ -307,7 +354,7 @@ class CloudDqDataplexClient:
         gcp_project_id: str = None,
         location_id: str = None,
         lake_name: str = None,
-    ) -> list[DataplexEntity]:
+    ) -> Iterator[dict]:
         params = {"page_size": 1000}
 
         if prefix and data_path:
@@ -317,47 +364,73 @@ class CloudDqDataplexClient:
         if data_path:
             params.update({"filter": f"data_path=starts_with({data_path})"})
 
-        response_dict = {}
-        response = self._client.list_entities(
+        # Page through the entities at the rate allowed by the API quota
+        while True:
+            self._list_entities_rate_limiter.acquire()
+            response_dict = self._client.list_entities(
+                zone_id=zone_id,
+                params=params,
+                gcp_project_id=gcp_project_id,
+                location_id=location_id,
+                lake_name=lake_name,
+            ).json()
+            yield response_dict
+            if "nextPageToken" not in response_dict:
+                break
+            logger.debug("Getting next page...")
+            params.update({"page_token": f"{response_dict['nextPageToken']}"})
+
+    def list_dataplex_entities(
+        self,
+        zone_id: str,
+        prefix: str = None,
+        data_path: str = None,
+        gcp_project_id: str = None,
+        location_id: str = None,
+        lake_name: str = None,
+    ) -> list[DataplexEntity]:
+        # Look up each listed entity while the next page is fetched
+        entity_futures = []
+        for response_dict in self._list_dataplex_entities_pages(
             zone_id=zone_id,
-            params=params,
+            prefix=prefix,
+            data_path=data_path,
             gcp_project_id=gcp_project_id,
             location_id=location_id,
             lake_name=lake_name,
-        )
-        response_dict.update(response.json())
+        ):
+            for entity in response_dict.get("entities", []):
+                entity_futures.append(
+                    self._entity_lookup_executor.submit(
+                        self.get_dataplex_entity,
+                        entity_id=entity["id"],
+                        zone_id=zone_id,
+                        gcp_project_id=gcp_project_id,
+                        location_id=location_id,
+                        lake_name=lake_name,
+                    )
+                )
+        return [future.result() for future in entity_futures]
 
-        while "nextPageToken" in response_dict:
-            time.sleep(3)  # to avoid api limit exceed error of 4 calls per 10 sec
-            next_page_token = response_dict["nextPageToken"]
-            logger.debug("Getting next page...")
-            page_token = {"page_token": f"{next_page_token}"}
-            params.update(page_token)
-            next_page_response = self._client.list_entities(
+    def list_dataplex_entities_count(
+        self,
+        zone_id: str,
+        prefix: str = None,
+        data_path: str = None,
+        gcp_project_id: str = None,
+        location_id: str = None,
+        lake_name: str = None,
+    ) -> int:
+        # Only the list pages are needed to count entities,
+        # skip the per-entity lookups done by list_dataplex_entities
+        return sum(
+            len(response_dict.get("entities", []))
+            for response_dict in self._list_dataplex_entities_pages(
                 zone_id=zone_id,
-                params=params,
+                prefix=prefix,
+                data_path=data_path,
                 gcp_project_id=gcp_project_id,
                 location_id=location_id,
                 lake_name=lake_name,
-            ).json()
-            logger.debug(f"Next page response {next_page_response}")
-
-            if "nextPageToken" not in next_page_response:
-                del response_dict["nextPageToken"]
-                response_dict = update_dict(response_dict, next_page_response)
-            else:
-                response_dict = update_dict(response_dict, next_page_response)
-                response_dict["nextPageToken"] = next_page_response["nextPageToken"]
-
-        dataplex_entities = []
-        if "entities" in response_dict:
-            for entity in response_dict["entities"]:
-                entity_with_schema = self.get_dataplex_entity(
-                    entity_id=entity["id"],
-                    zone_id=zone_id,
-                    gcp_project_id=gcp_project_id,
-                    location_id=location_id,
-                    lake_name=lake_name,
-                )
-                dataplex_entities.append(entity_with_schema)
-        return dataplex_entities
+            )
+        )
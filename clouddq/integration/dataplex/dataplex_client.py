@@ -23,7 +23,9 @@ import logging
 from google.auth.credentials import Credentials
 from requests import Response
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests_oauth2 import OAuth2BearerToken
+from urllib3.util.retry import Retry
 
 import google.auth
 import google.auth.transport.requests
@@ -33,6 +35,12 @@ from clouddq.integration.gcp_credentials import GcpCredentials
 
 logger = logging.getLogger(__name__)
 
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 64
+HTTP_MAX_RETRIES = 5
+HTTP_RETRY_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 
 class DataplexClient:
     _gcp_credentials: GcpCredentials
@@ -99,14 +107,41 @@ class DataplexClient:
 
     def _get_session(self) -> Session:
         """
-        This method create the session object for request
+        This method create the session object for request.
+        The session is kept open so that all Dataplex API calls
+        reuse pooled keep-alive connections.
         :return:
         session object
         """
-        with Session() as session:
-            session.auth = OAuth2BearerToken(self._auth_token)
+        session = Session()
+        session.auth = OAuth2BearerToken(self._auth_token)
+        # Only idempotent methods are retried, and the last response
+        # is returned to the caller instead of raising once retries run out
+        retries = Retry(
+            total=HTTP_MAX_RETRIES,
+            backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+            status_forcelist=HTTP_RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=retries,
+            ),
+        )
         return session
 
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> DataplexClient:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
     def get_dataplex_lake(
         self,
         lake_name: str,
@@ -268,7 +303,8 @@ class DataplexClient:
         location_id: str = None,
         lake_name: str = None,
     ) -> Response:
-        logger.debug(f"DataplexClient.get_entity() arguments: {locals()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DataplexClient.get_entity() arguments: %s", locals())
         if not zone_id:
             raise ValueError("zone_id is a required argument.")
         if not entity_id:
@@ -307,7 +343,8 @@ class DataplexClient:
         location_id: str = None,
         lake_name: str = None,
     ) -> Response:
-        logger.debug(f"DataplexClient.list_entities() arguments: {locals()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DataplexClient.list_entities() arguments: %s", locals())
         if not zone_id:
             raise ValueError("zone_id is a required argument.")
         if not gcp_project_id:
@@ -15,15 +15,23 @@
 from google.cloud import storage
 
 
+# Files larger than this are uploaded in chunks using a resumable upload
+GCS_UPLOAD_CHUNK_SIZE_BYTES = 8 * 1024 * 1024
+GCS_UPLOAD_TIMEOUT_SECONDS = 300
+
+
 def upload_blob(
     bucket_name: str, source_file_name: str, destination_blob_name: str
 ) -> None:
     """Uploads a file to the bucket."""
     destination_blob_name = str(destination_blob_name)
     storage_client = storage.Client()
-    bucket = storage_client.get_bucket(bucket_name)
-    blob = bucket.blob(destination_blob_name)
-    blob.upload_from_filename(source_file_name)
+    # bucket() does not call the API, the upload itself fails if it is missing
+    bucket = storage_client.bucket(bucket_name)
+    blob = bucket.blob(destination_blob_name, chunk_size=GCS_UPLOAD_CHUNK_SIZE_BYTES)
+    blob.upload_from_filename(
+        source_file_name, timeout=GCS_UPLOAD_TIMEOUT_SECONDS, checksum="crc32c"
+    )
     print(
         "File '{}' uploaded to 'gs://{}/{}'.".format(
             source_file_name, bucket_name, destination_blob_name
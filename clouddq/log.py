@@ -13,7 +13,9 @@
 # limitations under the License.
 
 from datetime import datetime
+from datetime import timezone
 
+import functools
 import json
 import logging
 import sys
@@ -23,6 +25,10 @@ import traceback
 APP_VERSION = "0.4.0"
 APP_NAME = "clouddq"
 LOG_LEVEL = logging._nameToLevel["DEBUG"]
+LOG_LABELS = {
+    "name": APP_NAME,
+    "releaseId": APP_VERSION,
+}
 
 
 class JsonEncoderStrFallback(json.JSONEncoder):
@@ -46,13 +52,22 @@ class JsonEncoderDatetime(JsonEncoderStrFallback):
 class JSONFormatter(logging.Formatter):
     def __init__(self):
         super().__init__()
+        # Reuse one encoder instead of constructing one per log record
+        self._json_encoder = JsonEncoderDatetime()
 
     def format(self, record):
-        record.msg = json.dumps(
+        traceback_lines = None
+        if record.exc_info:
+            traceback_lines = traceback.format_exception(*record.exc_info)
+            if not record.exc_text:
+                # Reuse the traceback for the text logging.Formatter.format()
+                # appends to the record, instead of formatting it twice
+                exc_text = "".join(traceback_lines)
+                record.exc_text = exc_text[:-1] if exc_text[-1:] == "\n" else exc_text
+        record.msg = self._json_encoder.encode(
             {
                 "severity": record.levelname,
-                "time": datetime.utcfromtimestamp(record.created)
-                .astimezone()
+                "time": datetime.fromtimestamp(record.created, timezone.utc)
                 .isoformat()
                 .replace("+00:00", "Z"),
                 "logging.googleapis.com/sourceLocation": {
@@ -61,20 +76,15 @@ class JSONFormatter(logging.Formatter):
                     "line": record.lineno,
                 },
                 "exception": record.exc_info,
-                "traceback": traceback.format_exception(*record.exc_info)
-                if record.exc_info
-                else None,
+                "traceback": traceback_lines,
                 "message": record.getMessage(),
-                "logging.googleapis.com/labels": {
-                    "name": APP_NAME,
-                    "releaseId": APP_VERSION,
-                },
-            },
-            cls=JsonEncoderDatetime,
+                "logging.googleapis.com/labels": LOG_LABELS,
+            }
         )
         return super().format(record)
 
 
+@functools.lru_cache(maxsize=None)
 def get_json_logger():
     json_logger = logging.getLogger("clouddq-json-logger")
     if not len(json_logger.handlers):
@@ -85,6 +95,7 @@ def get_json_logger():
     return json_logger
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger():
     logger = logging.getLogger("clouddq")
     if not len(logger.handlers):
@@ -197,6 +197,14 @@ coloredlogs.install(logger=logger)
     is_flag=True,
     default=False,
 )
+@click.option(
+    "--metadata_cache_ttl",
+    help="Number of seconds for which entity_uris resolved using "
+    "Dataplex Metadata API are reused from the local configs cache "
+    "instead of being looked up again. Defaults to 0 (no caching).",
+    type=int,
+    default=0,
+)
 def main(  # noqa: C901
     rule_binding_ids: str,
     rule_binding_config_path: str,
@@ -217,6 +225,7 @@ def main(  # noqa: C901
     skip_sql_validation: bool = False,
     summary_to_stdout: bool = False,
     enable_experimental_bigquery_entity_uris: bool = False,
+    metadata_cache_ttl: int = 0,
 ) -> None:
     """Run RULE_BINDING_IDS from a RULE_BINDING_CONFIG_PATH.
 
@@ -406,12 +415,15 @@ def main(  # noqa: C901
         )
         # Load all configs into a local cache
         configs_cache = lib.prepare_configs_cache(configs_path=Path(configs_path))
-        configs_cache.resolve_dataplex_entity_uris(
-            client=dataplex_client,
-            default_configs=dataplex_registry_defaults,
-            target_rule_binding_ids=target_rule_binding_ids,
-            enable_experimental_bigquery_entity_uris=enable_experimental_bigquery_entity_uris,
-        )
+        # Release the Dataplex client connection pool once entity_uris are resolved
+        with dataplex_client:
+            configs_cache.resolve_dataplex_entity_uris(
+                client=dataplex_client,
+                default_configs=dataplex_registry_defaults,
+                target_rule_binding_ids=target_rule_binding_ids,
+                enable_experimental_bigquery_entity_uris=enable_experimental_bigquery_entity_uris,
+                metadata_cache_ttl=metadata_cache_ttl,
+            )
         for rule_binding_id in target_rule_binding_ids:
             rule_binding_configs = all_rule_bindings.get(rule_binding_id, None)
             assert_not_none_or_empty(
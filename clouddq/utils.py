@@ -13,10 +13,10 @@
 # limitations under the License.
 
 """todo: add utils docstring."""
-from inspect import getsourcefile
 from pathlib import Path
 
 import contextlib
+import functools
 import hashlib
 import json
 import logging
@@ -25,6 +25,7 @@ import random
 import re
 import shutil
 import string
+import threading
 import time
 import typing
 
@@ -38,25 +39,36 @@ from jinja2 import select_autoescape
 import yaml
 
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
 
 MAXIMUM_EXPONENTIAL_BACKOFF_SECONDS = 32
+EXPONENTIAL_BACKOFF_BASE_SECONDS = 0.25
+STRIP_MARGIN_PATTERN = re.compile(r"\n[ \t]*\|")
+TEMPLATES_PATH = Path(__file__).resolve().parent.joinpath("templates")
 
 
 def load_yaml(file_path: Path, key: str = None) -> typing.Dict:
-    with file_path.open() as f:
-        yaml_configs = yaml.safe_load(f)
+    # Read bytes so that libyaml decodes the stream itself
+    with file_path.open("rb") as f:
+        yaml_configs = yaml.load(f, Loader=SafeLoader)
     if not yaml_configs:
         return dict()
     return yaml_configs.get(key, dict())
 
 
-def unnest_object_to_list(object: dict) -> list:
-    collection = []
+def unnest_object_to_iter(object: dict) -> typing.Iterator[dict]:
     for object_id, object_content in object.items():
-        collection.append({"id": object_id.upper(), **object_content})
-    return collection
+        yield {"id": object_id.upper(), **object_content}
+
+
+def unnest_object_to_list(object: dict) -> list:
+    return list(unnest_object_to_iter(object))
 
 
 def convert_json_value_to_dict(object: dict, key: str):
@@ -68,26 +80,29 @@ def convert_json_value_to_dict(object: dict, key: str):
 
 
 def get_templates_path(file_path: Path) -> Path:
-    template_path = (
-        Path(getsourcefile(lambda: 0)).resolve().parent.joinpath("templates", file_path)
-    )
-    return template_path
+    return TEMPLATES_PATH.joinpath(file_path)
 
 
-def get_template_file(file_path: Path) -> str:
+def get_template_file_path(file_path: Path) -> Path:
     template_path = get_templates_path(file_path)
     if not template_path.is_file():
         raise FileNotFoundError(
             f"No clouddq template found for file_path {file_path}"
             f" in path {template_path.absolute()}"
         )
-    data = template_path.read_text()
+    return template_path
+
+
+def get_template_file(file_path: Path) -> str:
+    data = get_template_file_path(file_path).read_text()
     return data
 
 
 def write_templated_file_to_path(path: Path, lookup_table: typing.Dict) -> None:
-    logger.debug(f"Writing templated file {get_templates_path(path.name)} to {path}")
-    path.write_text(get_template_file(lookup_table.get(path.name)))
+    template_path = get_template_file_path(lookup_table.get(path.name))
+    logger.debug(f"Writing templated file {template_path} to {path}")
+    # The templates are copied verbatim, so copy bytes without decoding them
+    shutil.copyfile(template_path, path)
 
 
 @contextlib.contextmanager
@@ -160,24 +175,27 @@ class DebugChainableUndefined(ChainableUndefined, DebugUndefined):
     pass
 
 
-def load_jinja_template(template_path: Path) -> Template:
-    try:
-        environment = load_jinja_template.environment
-        return environment.get_template(template_path.name)
-    except AttributeError:
-        templates_parent_path = get_templates_path(template_path.parent).absolute()
-        if not templates_parent_path.is_dir():
-            raise ValueError(
-                f"Error while loading template: {template_path}:\n"
-                f"Jinja template directory not found: "
-                f"{templates_parent_path.absolute()}"
-            )
-        load_jinja_template.environment = environment = Environment(
-            loader=FileSystemLoader(templates_parent_path),
-            autoescape=select_autoescape(),
-            undefined=DebugChainableUndefined,
+@functools.lru_cache(maxsize=8)
+def get_jinja_environment(templates_dir: Path) -> Environment:
+    templates_parent_path = get_templates_path(templates_dir).absolute()
+    if not templates_parent_path.is_dir():
+        raise ValueError(
+            f"Error while loading template from {templates_dir}:\n"
+            f"Jinja template directory not found: "
+            f"{templates_parent_path.absolute()}"
         )
-        return environment.get_template(template_path.name)
+    # Templates are packaged with clouddq, so never stat them for changes
+    return Environment(
+        loader=FileSystemLoader(templates_parent_path),
+        autoescape=select_autoescape(),
+        undefined=DebugChainableUndefined,
+        auto_reload=False,
+    )
+
+
+def load_jinja_template(template_path: Path) -> Template:
+    environment = get_jinja_environment(template_path.parent)
+    return environment.get_template(template_path.name)
 
 
 def get_format_string_arguments(format_string: str) -> typing.List[str]:
@@ -194,7 +212,7 @@ def strip_margin(text: str) -> str:
 
     """
 
-    return re.sub(r"\n[ \t]*\|", "\n", text.strip().lstrip("|"))
+    return STRIP_MARGIN_PATTERN.sub("\n", text.strip().lstrip("|"))
 
 
 def sha256_digest(text: str) -> str:
@@ -202,15 +220,47 @@ def sha256_digest(text: str) -> str:
 
 
 def exponential_backoff(
-    retry_iteration: int, max_retry_duration: int = MAXIMUM_EXPONENTIAL_BACKOFF_SECONDS
+    retry_iteration: int,
+    max_retry_duration: int = MAXIMUM_EXPONENTIAL_BACKOFF_SECONDS,
+    base_retry_duration: float = EXPONENTIAL_BACKOFF_BASE_SECONDS,
 ):
-    retry_duration = 2 ** retry_iteration + random.random()
+    retry_duration = base_retry_duration * (2 ** retry_iteration + random.random())
     if retry_duration <= max_retry_duration:
         time.sleep(retry_duration)
     else:
         raise RuntimeError("Maximum exponential backoff duration exceeded.")
 
 
+class TokenBucket:
+    """Thread-safe rate limiter allowing on average `rate` calls every
+    `per` seconds. The bucket starts with a single token and refills up to
+    `burst` tokens (default `rate`) while idle."""
+
+    def __init__(self, rate: int, per: float, burst: int | None = None) -> None:
+        self.rate = rate
+        self.per = per
+        self.burst = burst or rate
+        self._tokens = 1.0
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping only if none are available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated_at) * self.rate / self.per,
+            )
+            self._updated_at = now
+            # Reserve the token now, so that concurrent callers queue up
+            # behind it, and wait for it to be refilled outside of the lock
+            self._tokens -= 1
+            wait_seconds = -self._tokens * self.per / self.rate
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+
 def make_archive(source, destination, keep_top_level_folder=True):
     source = str(source)
     destination = str(destination)
@@ -228,17 +278,12 @@ def make_archive(source, destination, keep_top_level_folder=True):
 
 def update_dict(dict1: dict, dict2: dict) -> dict:
     output_dict = {}
-    for key in dict1.keys():
-        output_dict.update({key: []})
-        if type(dict1[key]) != str:
-            for value in dict1[key]:
-                output_dict[key].append(value)
-        else:
-            output_dict[key].append(dict1[key])
-        if type(dict2[key]) != str:
-            for value in dict2[key]:
-                output_dict[key].append(value)
+    for key, value in dict1.items():
+        merged = [value] if isinstance(value, str) else list(value)
+        other_value = dict2[key]
+        if isinstance(other_value, str):
+            merged.append(other_value)
         else:
-            output_dict[key].append(dict2[key])
-
+            merged.extend(other_value)
+        output_dict[key] = merged
     return output_dict
@@ -13,13 +13,16 @@
 # limitations under the License.
 from pathlib import Path
 
+import json
 import logging
 import os
 import shutil
 
 import pytest
 
+from clouddq.classes.dataplex_entity import DataplexEntity
 from clouddq.integration.dataplex.clouddq_dataplex import CloudDqDataplexClient
+from clouddq.lib import load_rules_config
 from clouddq.lib import prepare_configs_cache
 from clouddq.utils import working_directory
 
@@ -244,6 +247,31 @@ def test_dataplex_metadata_defaults_configs(
 def test_resources():
     return Path("tests").joinpath("resources").absolute()
 
+@pytest.fixture(scope="session")
+def mock_valid_dataplex_entity():
+    """Fixture that returns a static valid dataplex entity."""
+    with open(Path(__file__).parent.joinpath("resources", "mock_valid_dataplex_entity.json")) as f:
+        return DataplexEntity.from_dict(json.load(f))
+
+@pytest.fixture(scope="function")
+def stub_dataplex_client(mock_valid_dataplex_entity):
+    """Fixture that returns a Dataplex client stub resolving every
+    entity_uri to mock_valid_dataplex_entity and counting the calls."""
+
+    class StubDataplexClient:
+        get_dataplex_entity_calls = 0
+        list_dataplex_entities_calls = 0
+
+        def get_dataplex_entity(self, **kwargs):
+            self.get_dataplex_entity_calls += 1
+            return mock_valid_dataplex_entity
+
+        def list_dataplex_entities(self, **kwargs):
+            self.list_dataplex_entities_calls += 1
+            return [mock_valid_dataplex_entity]
+
+    return StubDataplexClient()
+
 @pytest.fixture(scope="session")
 def source_configs_path():
     return Path("tests").joinpath("resources", "configs").absolute()
@@ -281,7 +309,7 @@ def test_default_dataplex_configs_cache(temp_configs_dir,
         )
         yield configs_cache
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def temp_configs_dir(
         gcp_project_id,
         gcp_dataplex_bigquery_dataset_id,
@@ -289,9 +317,9 @@ def temp_configs_dir(
         gcp_dataplex_lake_name,
         gcp_dataplex_zone_id,
         source_configs_path,
-        tmp_path):
-    # Create temp directory
-    temp_clouddq_dir = Path(tmp_path).joinpath("clouddq_test_artifacts")
+        tmp_path_factory):
+    # Create temp directory once per session, tests must treat it as read-only
+    temp_clouddq_dir = tmp_path_factory.mktemp("clouddq_test_artifacts", numbered=False)
     # Copy over tests/resources/configs
     configs_path = Path(temp_clouddq_dir).joinpath("configs")
     _ = shutil.copytree(source_configs_path, configs_path)
@@ -328,6 +356,10 @@ def temp_configs_dir(
     if os.path.exists(temp_clouddq_dir):
         shutil.rmtree(temp_clouddq_dir)
 
+@pytest.fixture(scope="session")
+def rules_config(temp_configs_dir):
+    return load_rules_config(temp_configs_dir)
+
 @pytest.fixture(scope="function")
 def temp_configs_from_file(
         gcp_project_id,
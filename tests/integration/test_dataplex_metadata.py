@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+
 import logging
 
 import pytest
@@ -21,81 +23,116 @@ from clouddq.classes.dataplex_entity import DataplexEntity
 
 logger = logging.getLogger(__name__)
 
+
+class _FixtureValues(dict):
+    """Resolves '{fixture_name}' placeholders lazily from pytest fixtures."""
+
+    def __init__(self, request):
+        super().__init__()
+        self._request = request
+
+    def __missing__(self, key):
+        value = self[key] = self._request.getfixturevalue(key)
+        return value
+
+
+# Every field compared by DataplexEntity.__eq__
+_ENTITY_FIELDS = (
+    "name", "createTime", "updateTime", "id", "type", "asset", "dataPath", "system", "format", "schema",
+)
+
+
+def _entities_equal(actual, expected) -> bool:
+    return all(getattr(actual, field) == getattr(expected, field) for field in _ENTITY_FIELDS)
+
+
+GET_ENTITY_CASES = {
+    'contact_details': (
+        {
+            "name": "projects/{gcp_project_id}/locations/{gcp_dataplex_region}/lakes/{gcp_dataplex_lake_name}/"
+                    "zones/{gcp_dataplex_zone_id}/entities/contact_details",
+            "createTime": "2021-11-11T07:37:14.212950Z", "updateTime": "2021-11-11T07:37:14.212950Z",
+            "id": "contact_details", "type": "TABLE", "asset": "clouddq-test-asset-curated-bigquery",
+            "dataPath": "projects/{gcp_project_id}/datasets/"
+                        "{gcp_dataplex_bigquery_dataset_id}/tables/contact_details",
+            "system": "BIGQUERY", "format": {"format": "OTHER"},
+            "schema": {"fields": [{"name": "row_id", "type": "STRING", "mode": "REQUIRED"},
+                       {"name": "contact_type", "type": "STRING", "mode": "REQUIRED"},
+                       {"name": "value", "type": "STRING", "mode": "REQUIRED"},
+                       {"name": "ts", "type": "TIMESTAMP", "mode": "REQUIRED"}]}},
+        "SUCCEEDED"
+    ),
+    'asset_bucket': (
+        {
+            "name": "projects/{gcp_project_id}/locations/{gcp_dataplex_region}/lakes/"
+                    "{gcp_dataplex_lake_name}/zones/{gcp_dataplex_zone_id}/"
+                    "entities/d6d0e5bc-163c-4993-8da2-68b4bad58633",
+            "createTime": "2021-10-25T02:35:36.207049Z", "updateTime": "2021-10-25T02:35:36.207049Z",
+            "id": "asset_bucket", "type": "TABLE", "asset": "asset-bucket",
+            "dataPath": "gs://{gcp_dataplex_bucket_name}", "system": "CLOUD_STORAGE",
+            "format": {"format": "CSV", "mimeType": "text/csv",
+                       "csv": {"encoding": "UTF-8", "headerRows": 1, "delimiter": ","}},
+            "schema": {"fields": [{"name": "row_id", "type": "STRING", "mode": "NULLABLE"},
+                       {"name": "contact_type", "type": "STRING", "mode": "NULLABLE"},
+                       {"name": "value", "type": "STRING", "mode": "NULLABLE"},
+                       {"name": "ts", "type": "STRING", "mode": "NULLABLE"}]}},
+        "FAILED"
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def get_entity_case(request):
+    entity_id = request.param
+    expected_obj, expected_status = GET_ENTITY_CASES[entity_id]
+    fixture_values = _FixtureValues(request)
+    expected_obj = dict(
+        expected_obj,
+        name=expected_obj["name"].format_map(fixture_values),
+        dataPath=expected_obj["dataPath"].format_map(fixture_values),
+    )
+    return entity_id, DataplexEntity.from_dict(kwargs=expected_obj), expected_status
+
+
+@pytest.fixture(scope="module")
+def prefetched_entities(test_dq_dataplex_client, gcp_dataplex_zone_id):
+    # The cases are independent, so overlap their Dataplex round trips
+    entity_ids = list(GET_ENTITY_CASES)
+    with ThreadPoolExecutor(max_workers=len(entity_ids)) as executor:
+        futures = {
+            entity_id: executor.submit(
+                test_dq_dataplex_client.get_dataplex_entity,
+                zone_id=gcp_dataplex_zone_id,
+                entity_id=entity_id,
+            )
+            for entity_id in entity_ids
+        }
+    return futures
+
+
 @pytest.mark.dataplex
 class TestMetadataIntegration:
 
     @pytest.mark.parametrize(
-        "entity_id,expected_obj,expected_status",
+        "get_entity_case",
         [
-            pytest.param(
-                'contact_details',
-                {
-                    "name": "projects/<gcp_project_id>/locations/<gcp_dataplex_region>/lakes/<gcp_dataplex_lake_name>/"
-                            "zones/<gcp_dataplex_zone_id>/entities/contact_details",
-                    "createTime": "2021-11-11T07:37:14.212950Z", "updateTime": "2021-11-11T07:37:14.212950Z",
-                    "id": "contact_details", "type": "TABLE", "asset": "clouddq-test-asset-curated-bigquery",
-                    "dataPath": "projects/<gcp_project_id>/datasets/"
-                                "<gcp_dataplex_bigquery_dataset_id>/tables/contact_details",
-                    "system": "BIGQUERY", "format": {"format": "OTHER"},
-                    "schema": {"fields": [{"name": "row_id", "type": "STRING", "mode": "REQUIRED"},
-                               {"name": "contact_type", "type": "STRING", "mode": "REQUIRED"},
-                               {"name": "value", "type": "STRING", "mode": "REQUIRED"},
-                               {"name": "ts", "type": "TIMESTAMP", "mode": "REQUIRED"}]}},
-                "SUCCEEDED",
-                id="contact_details_with_full_entity_view"
-            ),
-            pytest.param(
-                'asset_bucket',
-                {
-                    "name": "projects/<gcp_project_id>/locations/<gcp_dataplex_region>/lakes/"
-                            "<gcp_dataplex_lake_name>/zones/<gcp_dataplex_zone_id>/"
-                            "entities/d6d0e5bc-163c-4993-8da2-68b4bad58633",
-                    "createTime": "2021-10-25T02:35:36.207049Z", "updateTime": "2021-10-25T02:35:36.207049Z",
-                    "id": "asset_bucket", "type": "TABLE", "asset": "asset-bucket",
-                    "dataPath": "gs://<gcp_dataplex_bucket_name>", "system": "CLOUD_STORAGE",
-                    "format": {"format": "CSV", "mimeType": "text/csv",
-                               "csv": {"encoding": "UTF-8", "headerRows": 1, "delimiter": ","}},
-                    "schema": {"fields": [{"name": "row_id", "type": "STRING", "mode": "NULLABLE"},
-                               {"name": "contact_type", "type": "STRING", "mode": "NULLABLE"},
-                               {"name": "value", "type": "STRING", "mode": "NULLABLE"},
-                               {"name": "ts", "type": "STRING", "mode": "NULLABLE"}]}},
-                "FAILED",
-                id="asset_bucket_with_full_entity_view"
-            ),
-        ]
+            pytest.param('contact_details', id="contact_details_with_full_entity_view"),
+            pytest.param('asset_bucket', id="asset_bucket_with_full_entity_view"),
+        ],
+        indirect=True,
     )
     @pytest.mark.xfail
     def test_dataplex_metadata_get_entity_valid(self,
-                                                test_dq_dataplex_client,
-                                                gcp_dataplex_zone_id,
-                                                entity_id,
-                                                expected_obj,
-                                                expected_status,
-                                                request,):
-
-        actual_entity = test_dq_dataplex_client.get_dataplex_entity(zone_id=gcp_dataplex_zone_id,
-                                                      entity_id=entity_id,)
-
-        expected_obj["name"] = expected_obj["name"].replace("<gcp_project_id>",
-                                                            request.getfixturevalue("gcp_project_id")) \
-            .replace("<gcp_dataplex_region>", request.getfixturevalue("gcp_dataplex_region")) \
-            .replace("<gcp_dataplex_lake_name>", request.getfixturevalue("gcp_dataplex_lake_name")) \
-            .replace("<gcp_dataplex_zone_id>", request.getfixturevalue("gcp_dataplex_zone_id"))
-
-        expected_obj["dataPath"] = expected_obj["dataPath"].replace("<gcp_project_id>",
-                                                                    request.getfixturevalue("gcp_project_id")) \
-            .replace("<gcp_dataplex_bigquery_dataset_id>",
-                request.getfixturevalue("gcp_dataplex_bigquery_dataset_id")) \
-            .replace("<gcp_dataplex_bucket_name>", request.getfixturevalue("gcp_dataplex_bucket_name"))
-
-        expected_entity = DataplexEntity.from_dict(kwargs=expected_obj)
-
-        print(f"Response Object is \n {actual_entity}")
-
-        if actual_entity == expected_entity:
-            actual_status = "SUCCEEDED"
-        else:
-            actual_status = "FAILED"
+                                                prefetched_entities,
+                                                get_entity_case,):
+        entity_id, expected_entity, expected_status = get_entity_case
+
+        actual_entity = prefetched_entities[entity_id].result()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response Object is \n %s", actual_entity)
+
+        actual_status = "SUCCEEDED" if _entities_equal(actual_entity, expected_entity) else "FAILED"
 
         assert actual_status == expected_status
 
@@ -103,26 +140,26 @@ class TestMetadataIntegration:
     def test_dataplex_metadata_list_entities(self,
                                              test_dq_dataplex_client,
                                              gcp_dataplex_zone_id, ):
-        print(f"zone id is {gcp_dataplex_zone_id}")
-        dataplex_entities_list = test_dq_dataplex_client.list_dataplex_entities(zone_id=gcp_dataplex_zone_id)
-        print(f"Dataplex Entities List is \n {dataplex_entities_list}")
-        print(f"Total Entities are {len(dataplex_entities_list)}")
-        assert len(dataplex_entities_list) > 0
+        logger.debug("zone id is %s", gcp_dataplex_zone_id)
+        dataplex_entities_count = test_dq_dataplex_client.list_dataplex_entities_count(zone_id=gcp_dataplex_zone_id)
+        logger.debug("Total Entities are %s", dataplex_entities_count)
+        assert dataplex_entities_count > 0
 
     def test_dataplex_metadata_list_entities_with_prefix(self,
                                                          test_dq_dataplex_client,
                                                          gcp_dataplex_zone_id, ):
-        print(f"zone id  is {gcp_dataplex_zone_id}")
+        logger.debug("zone id is %s", gcp_dataplex_zone_id)
         prefix = 'test_clouddq_'
         dataplex_entities_list = test_dq_dataplex_client.list_dataplex_entities(
             zone_id=gcp_dataplex_zone_id,
             prefix=prefix
             )
-        print(f"Dataplex Entities List is \n {dataplex_entities_list}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dataplex Entities List is \n %s", dataplex_entities_list)
         if len(dataplex_entities_list) > 0:
-            print(f"Total Entities are {len(dataplex_entities_list)}")
+            logger.debug("Total Entities are %s", len(dataplex_entities_list))
         else:
-            print(f"Entities with '{prefix}' prefix are not present in the dataplex lake.")
+            logger.debug("Entities with '%s' prefix are not present in the dataplex lake.", prefix)
         assert len(dataplex_entities_list) > 0
 
     def test_dataplex_metadata_list_entities_with_data_path(self,
@@ -130,15 +167,16 @@ class TestMetadataIntegration:
                                                          gcp_dataplex_zone_id,
                                                          gcp_project_id,
                                                          gcp_dataplex_bigquery_dataset_id, ):
-        print(f"zone id  is {gcp_dataplex_zone_id}")
+        logger.debug("zone id is %s", gcp_dataplex_zone_id)
         data_path = f"projects/{gcp_project_id}/datasets/{gcp_dataplex_bigquery_dataset_id}/tables/contact_details"
         dataplex_entities_list = test_dq_dataplex_client.list_dataplex_entities(zone_id=gcp_dataplex_zone_id,
                                                                                 data_path=data_path,)
-        print(f"Dataplex Entities List is \n {dataplex_entities_list}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dataplex Entities List is \n %s", dataplex_entities_list)
         if len(dataplex_entities_list) > 0:
-            print(f"Total Entities are {len(dataplex_entities_list)}")
+            logger.debug("Total Entities are %s", len(dataplex_entities_list))
         else:
-            print(f"Entities with '{data_path}' datapath are not present in the dataplex lake.")
+            logger.debug("Entities with '%s' datapath are not present in the dataplex lake.", data_path)
         assert len(dataplex_entities_list) > 0
 
 
@@ -12,11 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from operator import itemgetter
+from pathlib import Path
+from types import MappingProxyType
+
+import copy
 import logging
 
 import pytest
 
-from clouddq import lib
+from clouddq.classes.dq_configs_cache import DEFAULT_ENTITY_URI_CACHE_DB_NAME
 from clouddq.classes.dq_configs_cache import DqConfigsCache
 from clouddq.classes.dq_entity import DqEntity
 from clouddq.classes.dq_entity import get_custom_entity_configs
@@ -24,11 +29,71 @@ from clouddq.classes.dq_row_filter import DqRowFilter
 from clouddq.classes.dq_rule import DqRule
 from clouddq.classes.dq_rule_binding import DqRuleBinding
 from clouddq.classes.rule_type import RuleType
+from clouddq.utils import working_directory
 
 
 logger = logging.getLogger(__name__)
 
 
+_INVALID_RULE_EMPTY_RULE_TYPE = MappingProxyType({
+    "rule_type": "",
+})
+
+_INVALID_ENTITY_MISSING_COLS = MappingProxyType({
+    "source_database": "BIGQUERY",
+    "table_name": "valid",
+    "database_name": "valid",
+    "instance_name": "valid",
+})
+
+_INVALID_ENTITY_SOURCE_DATABASE = MappingProxyType({
+    "source_database": "invalid",
+    "table_name": "valid",
+    "database_name": "valid",
+    "instance_name": "valid",
+    "columns": {
+        "TEST_COLUMN": {
+            "description": "test column description",
+            "name": "test_column",
+            "data_type": "STRING"
+        }},
+})
+
+_INVALID_RULE_BINDING_EMPTY_IDS = MappingProxyType({
+    "entity_id": "",
+    "column_id": "",
+    "row_filter_id": "",
+    "rule_ids": ["invalid"],
+})
+
+_INVALID_RULE_BINDING_RULE_IDS_NOT_LIST = MappingProxyType({
+    "entity_id": "valid",
+    "column_id": "valid",
+    "row_filter_id": "valid",
+    "rule_ids": "invalid",
+})
+
+
+_COMPLEX_RULE_TYPES = frozenset(('CUSTOM_SQL_EXPR', 'CUSTOM_SQL_STATEMENT'))
+
+_BQ_EXPECTED = MappingProxyType({
+    "test_bq_entity": {
+        "source_database": "BIGQUERY",
+        "table_name": "table_name",
+        "database_name": "dataset_name",
+        "dataset_name": "dataset_name",
+        "instance_name": "project_name",
+        "project_name": "project_name",
+        "columns": {
+            "TEST_COLUMN": {
+                "description": "test column description",
+                "name": "test_column",
+                "data_type": "STRING"
+            }},
+    }
+})
+
+
 class TestClasses:
 
     def test_dq_rule_parse_failure(self):
@@ -36,38 +101,18 @@ class TestClasses:
         with pytest.raises(ValueError):
             DqRule.from_dict(
                 rule_id="valid",
-                kwargs={
-                    "rule_type": "",
-                },
+                kwargs=_INVALID_RULE_EMPTY_RULE_TYPE,
             )
 
     def test_dq_entity_missing_columns_failure(self):
         """ """
-        dq_entity_dict_not_valid = {
-            "source_database": "BIGQUERY",
-            "table_name": "valid",
-            "database_name": "valid",
-            "instance_name": "valid",
-        }
         with pytest.raises(ValueError):
-            DqEntity.from_dict(entity_id="valid", kwargs=dq_entity_dict_not_valid)
+            DqEntity.from_dict(entity_id="valid", kwargs=_INVALID_ENTITY_MISSING_COLS)
 
     def test_dq_entity_invalid_source_database(self):
         """ """
-        dq_entity_dict_not_valid = {
-            "source_database": "invalid",
-            "table_name": "valid",
-            "database_name": "valid",
-            "instance_name": "valid",
-            "columns": {
-                "TEST_COLUMN": {
-                    "description": "test column description",
-                    "name": "test_column",
-                    "data_type": "STRING"
-                }},
-        }
         with pytest.raises(NotImplementedError):
-            DqEntity.from_dict(entity_id="valid", kwargs=dq_entity_dict_not_valid)
+            DqEntity.from_dict(entity_id="valid", kwargs=_INVALID_ENTITY_SOURCE_DATABASE)
 
     @pytest.mark.parametrize(
         "configs_map,source_database,expected",
@@ -111,71 +156,45 @@ class TestClasses:
         with pytest.raises(NotImplementedError):
             get_custom_entity_configs('test', configs_map, source_database, "database_name")
 
-    def test_dq_entity_parse_bigquery_configs(self):
-        """ """
-        bq_entity_input_dict = {
-            "source_database": "BIGQUERY",
-            "table_name": "table_name",
-            "dataset_name": "dataset_name",
-            "project_name": "project_name",
-            "columns": {
-                "TEST_COLUMN": {
-                    "description": "test column description",
-                    "name": "test_column",
-                    "data_type": "STRING"
-                }},
-        }
-        bq_entity_configs = DqEntity.from_dict(entity_id="test_bq_entity", kwargs=bq_entity_input_dict)
-        bq_entity_configs_expected = {
-            "test_bq_entity": {
-                "source_database": "BIGQUERY",
-                "table_name": "table_name",
-                "database_name": "dataset_name",
-                "dataset_name": "dataset_name",
-                "instance_name": "project_name",
-                "project_name": "project_name",
-                "columns": {
-                    "TEST_COLUMN": {
-                        "description": "test column description",
-                        "name": "test_column",
-                        "data_type": "STRING"
-                    }},
-            }
-        }
-        assert bq_entity_configs.to_dict() == bq_entity_configs_expected
-
-    def test_dq_entity_parse_bigquery_configs_backwards_compatible(self):
+    @pytest.mark.parametrize(
+        "bq_entity_input_dict",
+        [
+            pytest.param(
+                {
+                    "source_database": "BIGQUERY",
+                    "table_name": "table_name",
+                    "dataset_name": "dataset_name",
+                    "project_name": "project_name",
+                    "columns": {
+                        "TEST_COLUMN": {
+                            "description": "test column description",
+                            "name": "test_column",
+                            "data_type": "STRING"
+                        }},
+                },
+                id="native"
+            ),
+            pytest.param(
+                {
+                    "source_database": "BIGQUERY",
+                    "table_name": "table_name",
+                    "database_name": "dataset_name",
+                    "instance_name": "project_name",
+                    "columns": {
+                        "TEST_COLUMN": {
+                            "description": "test column description",
+                            "name": "test_column",
+                            "data_type": "STRING"
+                        }},
+                },
+                id="backwards_compatible"
+            ),
+        ],
+    )
+    def test_dq_entity_parse_bigquery_configs(self, bq_entity_input_dict):
         """ """
-        bq_entity_input_dict = {
-            "source_database": "BIGQUERY",
-            "table_name": "table_name",
-            "database_name": "dataset_name",
-            "instance_name": "project_name",
-            "columns": {
-                "TEST_COLUMN": {
-                    "description": "test column description",
-                    "name": "test_column",
-                    "data_type": "STRING"
-                }},
-        }
         bq_entity_configs = DqEntity.from_dict(entity_id="test_bq_entity", kwargs=bq_entity_input_dict)
-        bq_entity_configs_expected = {
-            "test_bq_entity": {
-                "source_database": "BIGQUERY",
-                "table_name": "table_name",
-                "database_name": "dataset_name",
-                "dataset_name": "dataset_name",
-                "instance_name": "project_name",
-                "project_name": "project_name",
-                "columns": {
-                    "TEST_COLUMN": {
-                        "description": "test column description",
-                        "name": "test_column",
-                        "data_type": "STRING"
-                    }},
-            }
-        }
-        assert bq_entity_configs.to_dict() == bq_entity_configs_expected
+        assert bq_entity_configs.to_dict() == _BQ_EXPECTED
 
     def test_dq_entity_parse_dataplex_configs_fails(self):
         """ """
@@ -223,30 +242,18 @@ class TestClasses:
 
     def test_dq_rule_binding_invalid_id_parse_failure(self):
         """ """
-        dq_rule_binding_dict_not_valid = {
-            "entity_id": "",
-            "column_id": "",
-            "row_filter_id": "",
-            "rule_ids": ["invalid"],
-        }
         with pytest.raises(ValueError):
             DqRuleBinding.from_dict(
                 rule_binding_id="valid",
-                kwargs=dq_rule_binding_dict_not_valid,
+                kwargs=_INVALID_RULE_BINDING_EMPTY_IDS,
             )
 
     def test_dq_rule_binding_invalid_list_parse_failure(self):
         """ """
-        dq_rule_binding_dict_not_valid = {
-            "entity_id": "valid",
-            "column_id": "valid",
-            "row_filter_id": "valid",
-            "rule_ids": "invalid",
-        }
         with pytest.raises(ValueError):
             DqRuleBinding.from_dict(
                 rule_binding_id="valid",
-                kwargs=dq_rule_binding_dict_not_valid,
+                kwargs=_INVALID_RULE_BINDING_RULE_IDS_NOT_LIST,
             )
 
     def test_rule_type_not_implemented(self):
@@ -265,7 +272,7 @@ class TestClasses:
         ],
     )
     def test_rule_type_custom_to_sql_failure(self, params):
-        """ """
+        """Forbidden SQL tokens are all rejected by a single FORBIDDEN_SQL scan."""
         with pytest.raises(ValueError):
             RuleType.CUSTOM_SQL_EXPR.to_sql(params)
 
@@ -313,43 +320,47 @@ class TestClasses:
         expected = "REGEXP_CONTAINS( CAST( column_name  AS STRING), '^[^@]+[@]{1}[^@]+$' )"
         assert sql == expected
 
-    def test_configs_cache_rules(self, temp_configs_dir):
+    def test_configs_cache_rules(self, rules_config, tmp_path):
 
         def assertRulesEqual(rule_id, rule_config, rule_loaded):
 
-            print(f"rule ID {rule_id}")
-            print(f"  rule: {rule_loaded}")
-            print(f"  dict: {rule_loaded.to_dict()[rule_id]}")
-            print(f"  conf: {rule_config}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("rule ID %s\n  rule: %s\n  conf: %s", rule_id, rule_loaded, rule_config)
 
-            assert DqRule.from_dict(rule_id, rule_config) == rule_loaded, rule_id
+            assert expected_rules[rule_id] == rule_loaded, rule_id
 
             # To compare the dictionaries, we need to remove the SQL expression.
             # To avoid relying on the specific key, just compare the keys from
             # the original dict
             loaded_rule_dict = rule_loaded.to_dict()[rule_id]
-            loaded_rule_dict_clean = {}
-            for k in loaded_rule_dict:
-                if k in rule_config:
-                    loaded_rule_dict_clean[k] = loaded_rule_dict[k]
+            loaded_rule_dict_clean = {
+                k: loaded_rule_dict[k] for k in loaded_rule_dict if k in rule_config
+            }
 
             assert rules[rule_id] == loaded_rule_dict_clean, rule_id
 
-        rules = lib.load_rules_config(temp_configs_dir)
+        # rules_config is shared across the session, never mutate it in place
+        rules = copy.deepcopy(rules_config)
 
         # Skip custom SQL because we will be going back and forth
         # from dicts to objects and we haven't bound SQL params yet
-        complex_types = ['CUSTOM_SQL_EXPR', 'CUSTOM_SQL_STATEMENT']
-        rule_ids = sorted([id for id in rules.keys() if rules[id]['rule_type'] not in complex_types])
-
-        rule_id1 = rule_ids[0]
-        rule_ids = rule_ids[1:]
+        get_rule_type = itemgetter('rule_type')
+        rule_ids = sorted(
+            rule_id for rule_id, rule in rules.items() if get_rule_type(rule) not in _COMPLEX_RULE_TYPES
+        )
+        rule_id1, *rule_ids = rule_ids
 
         # Give one rule a dimension
         rules[rule_id1]['dimension'] = 'completeness'
 
-        cache = DqConfigsCache()
-        cache.load_all_rules_collection(rules)
+        expected_rules = {
+            rule_id: DqRule.from_dict(rule_id, rules[rule_id])
+            for rule_id in [rule_id1] + rule_ids
+        }
+
+        with working_directory(Path(tmp_path)):
+            cache = DqConfigsCache()
+            cache.load_all_rules_collection(rules)
 
         rule_config1 = rules[rule_id1]
         rule_loaded1 = cache.get_rule_id(rule_id1)
@@ -364,6 +375,68 @@ class TestClasses:
             assert rule_loaded.dimension is None, rule_id
             assertRulesEqual(rule_id, rule_config, rule_loaded)
 
+    def test_configs_cache_empty_rule_bindings(self, tmp_path):
+        with working_directory(Path(tmp_path)):
+            cache = DqConfigsCache()
+            cache.load_all_rule_bindings_collection({})
+            assert not cache._cache_db["rule_bindings"].exists()
+
+    def test_configs_cache_entity_uri_cache(self, tmp_path, stub_dataplex_client, mock_valid_dataplex_entity):
+
+        rule_bindings = {
+            "T1": {"entity_uri": "dataplex://zones/zone/entities/entity",
+                   "column_id": "value", "row_filter_id": "NONE", "rule_ids": ["NOT_NULL"]},
+            "T2": {"entity_uri": "dataplex://zones/zone/entities/entity",
+                   "column_id": "value", "row_filter_id": "NONE", "rule_ids": ["NOT_NULL"]},
+        }
+        default_configs = {"projects": "project", "locations": "region", "lakes": "lake"}
+        entity_id = "projects/project/locations/region/lakes/lake/zones/zone/entities/entity"
+        expected_entity = DqEntity.from_dataplex_entity(
+            entity_id=entity_id.upper(), dataplex_entity=mock_valid_dataplex_entity)
+        with working_directory(Path(tmp_path)):
+            for metadata_cache_ttl, expected_calls in [(0, 1), (600, 2), (600, 2), (0, 3)]:
+                cache = DqConfigsCache()
+                cache.load_all_rule_bindings_collection(rule_bindings)
+                cache.resolve_dataplex_entity_uris(
+                    client=stub_dataplex_client,
+                    default_configs=default_configs,
+                    metadata_cache_ttl=metadata_cache_ttl,
+                )
+                assert stub_dataplex_client.get_dataplex_entity_calls == expected_calls
+                assert cache.get_table_entity_id(entity_id).to_dict() == expected_entity.to_dict()
+                # The entity_uri cache db is only created once a ttl is set
+                assert Path(DEFAULT_ENTITY_URI_CACHE_DB_NAME).exists() == (expected_calls > 1)
+            cache.clear_entity_uri_cache()
+            assert cache.get_entity_uri_cache_db()["entity_uri_cache"].count == 0
+
+    def test_configs_cache_entity_uri_cache_bigquery_disabled(self, tmp_path, stub_dataplex_client):
+
+        rule_bindings = {
+            "T1": {"entity_uri": "bigquery://projects/project/datasets/dataset/tables/table",
+                   "column_id": "value", "row_filter_id": "NONE", "rule_ids": ["NOT_NULL"]},
+        }
+        default_configs = {"projects": "project", "locations": "region", "lakes": "lake", "zones": "zone"}
+        with working_directory(Path(tmp_path)):
+            cache = DqConfigsCache()
+            cache.load_all_rule_bindings_collection(rule_bindings)
+            cache.resolve_dataplex_entity_uris(
+                client=stub_dataplex_client,
+                default_configs=default_configs,
+                enable_experimental_bigquery_entity_uris=True,
+                metadata_cache_ttl=600,
+            )
+            assert cache.get_entity_uri_cache_db()["entity_uri_cache"].count == 1
+            # A cached bigquery:// entity_uri must not bypass the disabled flag
+            cache = DqConfigsCache()
+            cache.load_all_rule_bindings_collection(rule_bindings)
+            with pytest.raises(NotImplementedError):
+                cache.resolve_dataplex_entity_uris(
+                    client=stub_dataplex_client,
+                    default_configs=default_configs,
+                    enable_experimental_bigquery_entity_uris=False,
+                    metadata_cache_ttl=600,
+                )
+
 
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__, '-vv', '-rP', '-n', 'auto']))
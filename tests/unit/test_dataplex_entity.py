@@ -115,6 +115,12 @@ class TestDataplexEntity:
         with pytest.raises(ValueError):
             DataplexEntity.from_dict(kwargs=mock_invalid_dataplex_input)
 
+    def test_dataplex_entity_malformed_name_failure(self, mock_valid_dataplex_input):
+        """ """
+        mock_valid_dataplex_input["name"] = "projects/project-id/locations/location-id"
+        with pytest.raises(ValueError, match="Name: "):
+            DataplexEntity.from_dict(kwargs=mock_valid_dataplex_input)
+
 
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__, '-vv', '-rP', '-n', 'auto']))
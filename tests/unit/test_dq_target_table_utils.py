@@ -0,0 +1,107 @@
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import date
+from unittest import mock
+
+import logging
+
+from google.cloud import bigquery
+
+import pytest
+
+from clouddq.integration.bigquery.bigquery_client import BigQueryClient
+from clouddq.integration.bigquery.dq_target_table_utils import (
+    load_target_table_from_bigquery,
+)
+
+
+logger = logging.getLogger(__name__)
+
+INVOCATION_ID = "test-invocation-id"
+PARTITION_DATE = date(2021, 11, 11)
+TARGET_TABLE = "project.dataset.dq_summary_target"
+DQ_SUMMARY_TABLE = "project.dataset.dq_summary"
+
+
+class TestDqTargetTableUtils:
+
+    @pytest.fixture()
+    def expected_query_parameters(self):
+        return [
+            bigquery.ScalarQueryParameter("invocation_id", "STRING", INVOCATION_ID),
+            bigquery.ScalarQueryParameter("partition_date", "DATE", PARTITION_DATE),
+        ]
+
+    @staticmethod
+    def mock_bigquery_client(table_exists: bool) -> mock.Mock:
+        bigquery_client = mock.create_autospec(BigQueryClient, instance=True)
+        bigquery_client.is_table_exists.return_value = table_exists
+        return bigquery_client
+
+    @staticmethod
+    def load_target_table(bigquery_client, summary_to_stdout):
+        load_target_table_from_bigquery(
+            bigquery_client=bigquery_client,
+            invocation_id=INVOCATION_ID,
+            partition_date=PARTITION_DATE,
+            target_bigquery_summary_table=TARGET_TABLE,
+            dq_summary_table_name=DQ_SUMMARY_TABLE,
+            summary_to_stdout=summary_to_stdout,
+        )
+
+    def test_create_target_table(self, expected_query_parameters):
+        """ """
+        bigquery_client = self.mock_bigquery_client(table_exists=False)
+        self.load_target_table(bigquery_client, summary_to_stdout=False)
+
+        # The summary is not read back when it is not logged
+        bigquery_client.execute_query.assert_called_once()
+        _, kwargs = bigquery_client.execute_query.call_args
+        query_string = kwargs["query_string"]
+        assert f"CREATE TABLE\n        `{TARGET_TABLE}`" in query_string
+        assert f"SELECT * from `{DQ_SUMMARY_TABLE}`" in query_string
+        assert "invocation_id=@invocation_id" in query_string
+        assert "DATE(execution_ts)=@partition_date" in query_string
+        assert INVOCATION_ID not in query_string
+        assert kwargs["job_config"].query_parameters == expected_query_parameters
+
+    def test_create_target_table_summary_to_stdout(self, expected_query_parameters):
+        """ """
+        bigquery_client = self.mock_bigquery_client(table_exists=False)
+        self.load_target_table(bigquery_client, summary_to_stdout=True)
+
+        assert bigquery_client.execute_query.call_count == 2
+        _, kwargs = bigquery_client.execute_query.call_args
+        # The logged summary is read back from the new table
+        assert f"SELECT * from `{TARGET_TABLE}`" in kwargs["query_string"]
+        assert "invocation_id=@invocation_id" in kwargs["query_string"]
+        assert kwargs["job_config"].query_parameters == expected_query_parameters
+
+    def test_append_target_table(self, expected_query_parameters):
+        """ """
+        bigquery_client = self.mock_bigquery_client(table_exists=True)
+        self.load_target_table(bigquery_client, summary_to_stdout=False)
+
+        bigquery_client.execute_query.assert_called_once()
+        _, kwargs = bigquery_client.execute_query.call_args
+        assert f"SELECT * FROM `{DQ_SUMMARY_TABLE}`" in kwargs["query_string"]
+        assert INVOCATION_ID not in kwargs["query_string"]
+        job_config = kwargs["job_config"]
+        assert job_config.write_disposition == "WRITE_APPEND"
+        assert job_config.query_parameters == expected_query_parameters
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, '-vv', '-rP', '-n', 'auto']))
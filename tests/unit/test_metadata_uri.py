@@ -12,72 +12,143 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
+from types import MappingProxyType
+
+import dataclasses
+
 import pytest
 
 from clouddq.classes.dq_entity_uri import EntityUri
 
 
+_FAILURE_CASES = (
+    (
+        "dataplex://",
+        ValueError,
+        "incomplete_dataplex",
+    ),
+    (
+        "bigquery://",
+        ValueError,
+        "incomplete_bigquery",
+    ),
+    (
+        "local://",
+        NotImplementedError,
+        "incomplete_local",
+    ),
+    (
+        "gs://",
+        NotImplementedError,
+        "not_implemented_scheme",
+    ),
+    (
+        "dataplex:bigquery://",
+        NotImplementedError,
+        "invalid_scheme",
+    ),
+    (
+        "dataplex://projects/project-id/locations/us-central1/lakes/lake-id/zones/zone-id/entities",
+        ValueError,
+        "missing_entity_id",
+    ),
+    (
+        "dataplex://projects/project-id/locations/us-central1/lakes/lake-id/zones/zone-id/entities/",
+        ValueError,
+        "missing_entity_id_1",
+    ),
+    (
+        "dataplex://projects@",
+        ValueError,
+        "unsupported_@",
+    ),
+    (
+        "dataplex://projects:",
+        ValueError,
+        "unsupported_:",
+    ),
+    (
+        "dataplex://projects?",
+        ValueError,
+        "unsupported_?",
+    ),
+    (
+        "dataplex://projects#",
+        ValueError,
+        "unsupported_#",
+    ),
+)
+
+_TYPO_CASES = (
+    (
+        "dataplex://project/project-id/locations/us-central1/lakes/lake-id/zones/zone-id/entities/entity-id",
+        ValueError,
+        "typo_project",
+    ),
+    (
+        "dataplex://projects/project-id/location/us-central1/lakes/lake-id/zones/zone-id/entities/entity-id",
+        ValueError,
+        "typo_location",
+    ),
+    (
+        "dataplex://projects/project-id/locations/us-central1/lake/lake-id/zones/zone-id/entities/entity-id",
+        ValueError,
+        "typo_lake",
+    ),
+    (
+        "dataplex://projects/project-id/locations/us-central1/lakes/lake-id/zone/zone-id/entities/entity-id",
+        ValueError,
+        "typo_zone",
+    ),
+    (
+        "dataplex://projects/project-id/locations/us-central1/lakes/lake-id/zones/zone-id/entity/entity-id",
+        ValueError,
+        "typo_entity",
+    ),
+    (
+        "dataplex://projects/project-id/locations/us-central1/lakes/lake-id/zones/zone-id/entity/entity-id",
+        ValueError,
+        "typo_entity",
+    ),
+    (
+        "dataplex://project/project-id/location/us-central1/lakes/lake-id/zones/zone-id/entities/entity-id",
+        ValueError,
+        "typo_project_location",
+    ),
+    (
+        "dataplex://projects/project-id/location/us-central1/lake/lake-id/zones/zone-id/entities/entity-id",
+        ValueError,
+        "typo_location_lake",
+    ),
+    (
+        "dataplex://project/project-id/location/us-central1/lake/lake-id/zones/zone-id/entities/entity-id",
+        ValueError,
+        "typo_project_location_lake",
+    ),
+    (
+        "dataplex://project/project-id/location/us-central1/lake/lake-id/zone/zone-id/entities/entity-id",
+        ValueError,
+        "typo_project_location_lake_zone",
+    ),
+    (
+        "dataplex://project/project-id/location/us-central1/lake/lake-id/zone/zone-id/entity/entity-id",
+        ValueError,
+        "typo_project_location_lake_zone_entity",
+    ),
+    (
+        "dataplex://project/project-id/location//lakes/lake-id/zones/zone-id/entities/entity-id",
+        ValueError,
+        "missing_location",
+    ),
+)
+
+
 class TestEntityURI:
 
     @pytest.mark.parametrize(
         "entity_uri,error_type",
-        [
-            pytest.param(
-                "dataplex://",
-                ValueError,
-                id="incomplete_dataplex"
-            ),
-            pytest.param(
-                "bigquery://",
-                ValueError,
-                id="incomplete_bigquery"
-            ),
-            pytest.param(
-                "local://",
-                NotImplementedError,
-                id="incomplete_local"
-            ),
-            pytest.param(
-                "gs://",
-                NotImplementedError,
-                id="not_implemented_scheme"
-            ),
-            pytest.param(
-                "dataplex:bigquery://",
-                NotImplementedError,
-                id="invalid_scheme"
-            ),
-            pytest.param(
-                "dataplex://projects/project-id/locations/us-central1/lakes/lake-id/zones/zone-id/entities",
-                ValueError,
-                id="missing_entity_id"
-            ),
-            pytest.param(
-                "dataplex://projects/project-id/locations/us-central1/lakes/lake-id/zones/zone-id/entities/",
-                ValueError,
-                id="missing_entity_id_1"
-            ),
-            pytest.param(
-                "dataplex://projects@",
-                ValueError,
-                id="unsupported_@"
-            ),
-            pytest.param(
-                "dataplex://projects:",
-                ValueError,
-                id="unsupported_:"
-            ),
-            pytest.param(
-                "dataplex://projects?",
-                ValueError,
-                id="unsupported_?"
-            ),
-            pytest.param(
-                "dataplex://projects#",
-                ValueError,
-                id="unsupported_#"
-            ),
-        ],
+        [pytest.param(uri, error_type, id=case_id) for uri, error_type, case_id in _FAILURE_CASES],
     )
     def test_entity_uri_parse_failure(self, entity_uri, error_type):
         """ """
@@ -117,68 +188,7 @@ class TestEntityURI:
 
     @pytest.mark.parametrize(
         "entity_uri,error_type",
-        [
-            pytest.param(
-                "dataplex://project/project-id/locations/us-central1/lakes/lake-id/zones/zone-id/entities/entity-id",  # noqa: E501
-                ValueError,
-                id="typo_project"
-            ),
-            pytest.param(
-                "dataplex://projects/project-id/location/us-central1/lakes/lake-id/zones/zone-id/entities/entity-id",
-                ValueError,
-                id="typo_location"
-            ),
-            pytest.param(
-                "dataplex://projects/project-id/locations/us-central1/lake/lake-id/zones/zone-id/entities/entity-id",
-                ValueError,
-                id="typo_lake"
-            ),
-            pytest.param(
-                "dataplex://projects/project-id/locations/us-central1/lakes/lake-id/zone/zone-id/entities/entity-id",
-                ValueError,
-                id="typo_zone"
-            ),
-            pytest.param(
-                "dataplex://projects/project-id/locations/us-central1/lakes/lake-id/zones/zone-id/entity/entity-id",
-                ValueError,
-                id="typo_entity"
-            ),
-            pytest.param(
-                "dataplex://projects/project-id/locations/us-central1/lakes/lake-id/zones/zone-id/entity/entity-id",
-                ValueError,
-                id="typo_entity"
-            ),
-            pytest.param(
-                "dataplex://project/project-id/location/us-central1/lakes/lake-id/zones/zone-id/entities/entity-id",
-                ValueError,
-                id="typo_project_location"
-            ),
-            pytest.param(
-                "dataplex://projects/project-id/location/us-central1/lake/lake-id/zones/zone-id/entities/entity-id",
-                ValueError,
-                id="typo_location_lake"
-            ),
-            pytest.param(
-                "dataplex://project/project-id/location/us-central1/lake/lake-id/zones/zone-id/entities/entity-id",
-                ValueError,
-                id="typo_project_location_lake"
-            ),
-            pytest.param(
-                "dataplex://project/project-id/location/us-central1/lake/lake-id/zone/zone-id/entities/entity-id",
-                ValueError,
-                id="typo_project_location_lake_zone"
-            ),
-            pytest.param(
-                "dataplex://project/project-id/location/us-central1/lake/lake-id/zone/zone-id/entity/entity-id",
-                ValueError,
-                id="typo_project_location_lake_zone_entity"
-            ),
-            pytest.param(
-                "dataplex://project/project-id/location//lakes/lake-id/zones/zone-id/entities/entity-id",
-                ValueError,
-                id="missing_location"
-            ),
-        ],
+        [pytest.param(uri, error_type, id=case_id) for uri, error_type, case_id in _TYPO_CASES],
     )
     def test_entity_uri_typo_parse_failure(self, entity_uri, error_type):
         with pytest.raises(error_type):
@@ -268,6 +278,37 @@ class TestEntityURI:
         assert parsed_uri.configs_dict == expected_entity_dict["configs"]
         assert parsed_uri.to_dict() == expected_entity_dict
 
+    def test_entity_uri_parse_cached(self):
+        """ """
+        dataplex_uri = "dataplex://zones/zone-id/entities/entity-id"
+        default_configs = {"projects": "project-id", "locations": "region", "lakes": "lake-id"}
+        parsed_uri = EntityUri.from_uri(dataplex_uri, default_configs=default_configs)
+        assert EntityUri.from_uri(dataplex_uri, default_configs=dict(default_configs)) is parsed_uri
+        assert EntityUri.from_uri(dataplex_uri, default_configs={
+            **default_configs, "lakes": "other-lake-id"}) is not parsed_uri
+        assert parsed_uri.default_configs == default_configs
+        with pytest.raises(TypeError):
+            parsed_uri.configs_dict["entities"] = "other-entity-id"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            parsed_uri.uri_configs_string = "zones/other-zone-id"
+        assert parsed_uri.get_entity_id() == "entity-id"
+
+    def test_entity_uri_parse_default_configs_mapping(self):
+        """ """
+        dataplex_uri = "dataplex://zones/zone-id/entities/entity-id"
+        default_configs = {"projects": "project-id", "locations": "region", "lakes": "lake-id"}
+        parsed_uri = EntityUri.from_uri(dataplex_uri, default_configs=default_configs)
+        # Mappings other than dict are applied and share the cache entry
+        assert EntityUri.from_uri(dataplex_uri, default_configs=MappingProxyType(default_configs)) is parsed_uri
+        assert EntityUri.from_uri(dataplex_uri, default_configs=OrderedDict(default_configs)) is parsed_uri
+        # Unhashable default values are applied without caching the result
+        unhashable_configs = {**default_configs, "labels": ["label"]}
+        parsed_uri = EntityUri.from_uri(dataplex_uri, default_configs=unhashable_configs)
+        assert parsed_uri.configs_dict["labels"] == ["label"]
+        assert parsed_uri.get_db_primary_key() == \
+            "projects/project-id/locations/region/lakes/lake-id/zones/zone-id/entities/entity-id"
+        assert EntityUri.from_uri(dataplex_uri, default_configs=unhashable_configs) is not parsed_uri
+
 
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__, '-vv', '-rP', '-n', 'auto']))
@@ -14,6 +14,8 @@
 
 
 import logging
+import threading
+import time
 
 import pytest
 
@@ -34,6 +36,35 @@ class TestUtils:
         with pytest.raises(ValueError):
             utils.get_keys_from_dict_and_assert_oneof('two', kwargs=kwargs, keys=['a', 'b'])
 
+    def test_update_dict(self):
+        dict1 = {'entities': [1, 2], 'nextPageToken': 'a'}
+        dict2 = {'entities': [3], 'nextPageToken': 'b'}
+        assert utils.update_dict(dict1, dict2) == {'entities': [1, 2, 3], 'nextPageToken': ['a', 'b']}
+        assert dict1 == {'entities': [1, 2], 'nextPageToken': 'a'}
+
+    def test_token_bucket(self):
+        bucket = utils.TokenBucket(rate=2, per=0.2)
+        start = time.monotonic()
+        # Only the first token is available immediately
+        bucket.acquire()
+        assert time.monotonic() - start < 0.05
+        # Further calls are spaced out to 'rate' calls every 'per' seconds
+        bucket.acquire()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.19
+
+    def test_token_bucket_concurrent(self):
+        bucket = utils.TokenBucket(rate=1, per=0.4)
+        bucket.acquire()
+        waiting_thread = threading.Thread(target=bucket.acquire)
+        waiting_thread.start()
+        time.sleep(0.1)
+        # The waiting caller sleeps without holding the lock
+        assert waiting_thread.is_alive()
+        assert bucket._lock.acquire(timeout=0.05)
+        bucket._lock.release()
+        waiting_thread.join()
+
 
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__, '-vv', '-rP', '-n', 'auto']))